@@ -17,6 +17,7 @@ from rich.table import Table
 
 from mygooglib import get_clients
 from mygooglib.services.drive import (
+    MIN_FIELDS,
     create_folder,
     delete_file,
     download_file,
@@ -41,7 +42,7 @@ def _resolve_id(identifier: str) -> str:
 
     # Try resolving as path
     clients = get_clients()
-    meta = resolve_path(clients.drive.service, identifier)
+    meta = resolve_path(clients.drive.service, identifier, fields=MIN_FIELDS)
     if meta:
         return meta["id"]
 
@@ -62,7 +63,7 @@ def list_cmd(
         None, "--mime-type", help="Filter by MIME type."
     ),
     trashed: bool = typer.Option(False, "--trashed", help="Include trashed files."),
-    page_size: int = typer.Option(100, "--page-size", min=1, max=1000),
+    page_size: int = typer.Option(1000, "--page-size", min=1, max=1000),
     interactive: bool = typer.Option(
         False, "--interactive", "-i", help="Interactively select a file for actions."
     ),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,11 +24,16 @@ from PySide6.QtWidgets import (
 from mygoog_gui.styles import COLORS
 from mygoog_gui.widgets.drive_tree import FileTreeWidget
 from mygoog_gui.workers import ApiWorker
+from mygooglib import clear_response_cache
 
 if TYPE_CHECKING:
     from mygoog_gui.widgets.activity import ActivityModel
     from mygooglib import Clients
 
+# Re-expanding a folder or repeating a search within this window reuses the
+# previous listing instead of calling Drive again.
+LISTING_CACHE_TTL_S = 60
+
 
 class DrivePage(QWidget):
     """Google Drive file browser."""
@@ -43,6 +49,9 @@ class DrivePage(QWidget):
         self.activity_model = activity_model
         self._workers: list = []  # type: ignore[var-annotated]
         self._files: list[dict] = []
+        # (query, results, fetched_at) of the last server-side search, used to
+        # narrow refined searches locally instead of querying Drive again.
+        self._last_search: tuple[str, list[dict], float] | None = None
         self._setup_ui()
         self._load_root()
 
@@ -83,7 +92,7 @@ class DrivePage(QWidget):
         toolbar.addWidget(sync_btn)
 
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self._load_root)
+        refresh_btn.clicked.connect(self._refresh)
         toolbar.addWidget(refresh_btn)
 
         layout.addLayout(toolbar)
@@ -100,30 +109,71 @@ class DrivePage(QWidget):
         self.status.setStyleSheet(f"color: {COLORS['text_secondary']};")
         layout.addWidget(self.status)
 
+    def _refresh(self) -> None:
+        """Reload the root listing, bypassing cached listings."""
+        clear_response_cache()
+        self._last_search = None
+        self._load_root()
+
     def _load_root(self, query: str | None = None) -> None:
         """Load root files from Drive."""
         self.status.setText("Loading root..." if not query else "Searching...")
         self.tree.clear()
 
+        if query:
+            narrowed = self._narrow_last_search(query)
+            if narrowed is not None:
+                self._on_folder_loaded(None, narrowed)
+                return
+
         def fetch():
             # If query is present, we might get a flat list, but that's okay.
             # Tree can handle top-level items.
             q_str = f"name contains '{query}'" if query else "'root' in parents"
-            return self.clients.drive.list_files(query=q_str, page_size=100)
+            return self.clients.drive.list_files(
+                query=q_str, cache_ttl_s=LISTING_CACHE_TTL_S
+            )
+
+        def on_loaded(files: list[dict]) -> None:
+            if query:
+                self._last_search = (query.lower(), files, time.monotonic())
+            self._on_folder_loaded(None, files)
 
         worker = ApiWorker(fetch)
-        worker.finished.connect(lambda files: self._on_folder_loaded(None, files))
+        worker.finished.connect(on_loaded)
         worker.error.connect(self._on_error)
         self._workers.append(worker)
         worker.start()
 
+    def _narrow_last_search(self, query: str) -> list[dict] | None:
+        """Filter the previous search results if `query` refines it.
+
+        Returns None when the server must be queried (no recent search, or
+        the new query doesn't extend the previous one). Drive's `name
+        contains` matches word prefixes, not arbitrary substrings, so only a
+        query that starts with the previous one is guaranteed a subset of
+        its results: "port" never returned "my report.pdf".
+        """
+        if self._last_search is None:
+            return None
+        last_query, last_files, fetched_at = self._last_search
+        needle = query.lower()
+        if (
+            not needle.startswith(last_query)
+            or time.monotonic() - fetched_at > LISTING_CACHE_TTL_S
+        ):
+            return None
+        return [f for f in last_files if needle in f.get("name", "").lower()]
+
     def _load_folder_contents(self, item: QTreeWidgetItem, folder_id: str) -> None:
         """Load contents of a specific folder."""
         self.status.setText("Loading folder...")
 
         def fetch():
             # List files in this specific parent folder
-            return self.clients.drive.list_files(parent_id=folder_id)
+            return self.clients.drive.list_files(
+                parent_id=folder_id, cache_ttl_s=LISTING_CACHE_TTL_S
+            )
 
         worker = ApiWorker(fetch)
         worker.finished.connect(lambda files: self._on_folder_loaded(item, files))
@@ -186,7 +236,7 @@ class DrivePage(QWidget):
         """Handle upload completion."""
         self.status.setText(f"Uploaded: {name} (ID: {file_id[:12]}...)")
         # Auto-refresh to show the new file
-        self._load_root()
+        self._refresh()
 
     def _show_context_menu(self, pos) -> None:
         """Show right-click context menu."""
@@ -229,7 +279,9 @@ class DrivePage(QWidget):
         self.status.setText(f"Downloading {name}...")
 
         def download():
-            return self.clients.drive.download_file(file_id, save_path)
+            return self.clients.drive.download_file(
+                file_id, save_path, mime_type_hint=file.get("mimeType")
+            )
 
         worker = ApiWorker(download)
         worker.finished.connect(lambda _: self.status.setText(f"Downloaded: {name}"))
@@ -266,7 +318,7 @@ class DrivePage(QWidget):
         """Handle delete completion."""
         self.status.setText(f"Deleted: {name}")
         # Auto-refresh to remove the deleted file from view
-        self._load_root()
+        self._refresh()
 
     def _on_new_folder(self) -> None:
         """Create a new folder."""
@@ -301,7 +353,7 @@ class DrivePage(QWidget):
     def _on_folder_created(self, name: str) -> None:
         """Handle folder creation completion."""
         self.status.setText(f"Created folder: {name}")
-        self._load_root()
+        self._refresh()
 
     def _on_sync_folder(self) -> None:
         """Handle sync folder to sheets action."""
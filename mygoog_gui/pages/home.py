@@ -224,7 +224,9 @@ class HomePage(QScrollArea):
 
     def _load_drive(self) -> None:
         def fetch():
-            return self.clients.drive.list_files(page_size=5)
+            return self.clients.drive.list_files(
+                max_results=5, fields="id, name, mimeType"
+            )
 
         worker = ApiWorker(fetch)
         worker.finished.connect(self._on_drive_loaded)
@@ -145,7 +145,7 @@ class SyncWorker(QThread):
             self.started_upload.emit(len(files))
             headers = ["Filename", "Path", "Last Modified"]
             rows = [
-                [f["filename"], f["absolute_path"], str(f["last_modified_timestamp"])]
+                [f.filename, f.absolute_path, str(f.last_modified_timestamp)]
                 for f in files
             ]
 
@@ -31,6 +31,7 @@ from mygooglib.core.types import (
     MessageDict,
     MessageFullDict,
     MessageMetadataDict,
+    MessageMetadataTable,
     # Sheets types
     RangeData,
     SendMessageResponseDict,
@@ -42,8 +43,9 @@ from mygooglib.core.types import (
     UpdateValuesResponseDict,
     ValueRangeDict,
 )
-from mygooglib.core.utils.file_scanner import FileScanner
+from mygooglib.core.utils.file_scanner import FileEntry, FileScanner
 from mygooglib.core.utils.logging import get_logger
+from mygooglib.core.utils.retry import clear_response_cache
 
 # Non-breaking aliases for a cleaner public API.
 create = get_clients
@@ -61,8 +63,10 @@ __all__ = [
     "SCOPES",
     "get_auth_paths",
     "verify_creds_exist",
+    "FileEntry",
     "FileScanner",
     "get_logger",
+    "clear_response_cache",
     "types",
     # Calendar Types
     "CalendarEventDict",
@@ -77,6 +81,7 @@ __all__ = [
     "MessageDict",
     "MessageFullDict",
     "MessageMetadataDict",
+    "MessageMetadataTable",
     "SendMessageResponseDict",
     # Sheets Types
     "RangeData",
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 from googleapiclient.discovery import build
 
 from mygooglib.core.auth import get_creds
+from mygooglib.core.utils.json_backend import configure_json_backend
 from mygooglib.core.utils.logging import configure_from_env
 from mygooglib.services.appscript import AppScriptClient
 from mygooglib.services.calendar import CalendarClient
@@ -27,6 +29,13 @@ class Clients:
     """Container holding all Google API service wrappers.
 
     All clients are lazily loaded on first access for performance.
+
+    Each service is built with its own google-auth AuthorizedHttp over an
+    httplib2.Http, which keeps TLS connections alive per host, so repeated
+    calls on one service reuse the same connection. httplib2 is not
+    thread-safe; code that fans a single service out across threads must
+    give each thread its own Http (see drive._thread_http). Sheets and Docs
+    share the Drive service built for .drive instead of opening their own.
     """
 
     _creds: "Credentials"
@@ -44,8 +53,9 @@ class Clients:
         if cached is None:
             service = build(api_name, version, credentials=self._creds)
             if needs_drive:
-                drive_service = build("drive", "v3", credentials=self._creds)
-                cached = client_class(service, drive=drive_service)
+                # Reuse the Drive service (and its kept-alive connection)
+                # rather than building a second one per dependent client.
+                cached = client_class(service, drive=self.drive.service)
             else:
                 cached = client_class(service)
             object.__setattr__(self, f"_{attr_name}", cached)
@@ -108,6 +118,7 @@ class Clients:
 
 
 _DEFAULT_CLIENTS: Clients | None = None
+_DEFAULT_CLIENTS_LOCK = threading.Lock()
 
 
 def get_clients(
@@ -121,7 +132,8 @@ def get_clients(
     Args:
         creds: Optional pre-loaded credentials. If None, calls get_creds().
         use_cache: If True (default) and creds is None, cache and reuse the
-            built service objects within the current Python process.
+            built service objects within the current Python process. The
+            cache is shared across threads and built at most once.
         scopes: Optional list of scopes to request if creds is None.
 
     Returns:
@@ -129,25 +141,35 @@ def get_clients(
     """
     global _DEFAULT_CLIENTS
 
+    is_default_creds = creds is None
+
+    if is_default_creds and use_cache:
+        # Fast path without taking the lock once the cache is populated.
+        cached = _DEFAULT_CLIENTS
+        if cached is not None:
+            return cached
+        with _DEFAULT_CLIENTS_LOCK:
+            if _DEFAULT_CLIENTS is None:
+                _DEFAULT_CLIENTS = _build_clients(None, scopes)
+            return _DEFAULT_CLIENTS
+
+    return _build_clients(creds, scopes)
+
+
+def _build_clients(creds: "Credentials | None", scopes: list[str] | None) -> Clients:
+    """Configure the process and build a Clients container (internal helper)."""
     # Opt-in debug logging via env vars.
     configure_from_env()
 
+    # Opt-in fast JSON decoding (MYGOOGLIB_JSON_BACKEND=orjson).
+    configure_json_backend()
+
     # Prevent indefinite hangs on network/auth issues
     import socket
 
     socket.setdefaulttimeout(60)
 
-    is_default_creds = creds is None
-
-    if is_default_creds and use_cache and _DEFAULT_CLIENTS is not None:
-        return _DEFAULT_CLIENTS
-
     if creds is None:
         creds = get_creds(scopes=scopes)
 
-    clients = Clients(_creds=creds)
-
-    if use_cache and is_default_creds:
-        _DEFAULT_CLIENTS = clients
-
-    return clients
+    return Clients(_creds=creds)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from googleapiclient.errors import HttpError
+
 
 class GoogleApiError(Exception):
     """Base exception for mygooglib errors."""
@@ -42,18 +44,11 @@ def raise_for_http_error(http_error: Exception, *, context: str | None = None) -
         except HttpError as e:
             raise_for_http_error(e)
     """
-    # Lazy import to avoid hard dependency at module load
-    from googleapiclient.errors import HttpError
-
     if not isinstance(http_error, HttpError):
         raise http_error
 
     status = http_error.resp.status
-    reason = (
-        http_error._get_reason()
-        if hasattr(http_error, "_get_reason")
-        else str(http_error)
-    )
+    reason = http_error._get_reason()
 
     prefix = f"{context}: " if context else ""
 
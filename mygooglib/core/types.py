@@ -8,6 +8,8 @@ All TypedDicts use total=False since Google API responses often omit optional fi
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
 # =============================================================================
@@ -455,6 +457,7 @@ class MessageMetadataDict(TypedDict, total=False):
     threadId: str
     subject: str
     from_: str  # 'from' is a reserved word
+    sender: str  # Same value as 'from'; omitted with legacy_sender_field=False
     to: str
     date: str
     snippet: str
@@ -467,6 +470,71 @@ class MessageMetadataDict(TypedDict, total=False):
     # but we can just use the from_ convention.
 
 
+@dataclass
+class MessageMetadataTable:
+    """Column-oriented (struct-of-arrays) variant of search_messages results.
+
+    Holds one list per field instead of one dict per message, which keeps
+    large searches compact and converts to a DataFrame without a per-row
+    transpose.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    thread_ids: list[str] = field(default_factory=list)
+    subjects: list[str | None] = field(default_factory=list)
+    from_: list[str | None] = field(default_factory=list)
+    to: list[str | None] = field(default_factory=list)
+    dates: list[str | None] = field(default_factory=list)
+    snippets: list[str | None] = field(default_factory=list)
+    label_ids: list[list[str]] = field(default_factory=list)
+    is_unread: list[bool] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_messages(
+        cls, messages: Iterable[Mapping[str, Any]]
+    ) -> MessageMetadataTable:
+        """Build a table from search_messages result dicts."""
+        table = cls()
+        for msg in messages:
+            labels = msg.get("labelIds") or []
+            table.ids.append(msg.get("id") or "")
+            table.thread_ids.append(msg.get("threadId") or "")
+            table.subjects.append(msg.get("subject"))
+            table.from_.append(msg.get("from", msg.get("from_")))
+            table.to.append(msg.get("to"))
+            table.dates.append(msg.get("date"))
+            table.snippets.append(msg.get("snippet"))
+            table.label_ids.append(labels)
+            table.is_unread.append("UNREAD" in labels)
+        return table
+
+    def to_pandas(self) -> Any:
+        """Return the table as a pandas DataFrame (requires 'pandas')."""
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "Pandas is required for this feature. Install 'pandas'."
+            ) from e
+
+        return pd.DataFrame(
+            {
+                "id": self.ids,
+                "threadId": self.thread_ids,
+                "subject": self.subjects,
+                "from": self.from_,
+                "to": self.to,
+                "date": self.dates,
+                "snippet": self.snippets,
+                "labelIds": self.label_ids,
+                "isUnread": self.is_unread,
+            }
+        )
+
+
 class MessageFullDict(TypedDict, total=False):
     """Full message details returned by get_message.
 
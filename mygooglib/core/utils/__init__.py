@@ -1,19 +1,39 @@
 """Shared utility helpers."""
 
-from mygooglib.core.utils.a1 import a1_to_col, col_to_a1, range_to_a1
+from mygooglib.core.utils.a1 import (
+    a1_to_col,
+    build_ranges,
+    col_to_a1,
+    range_to_a1,
+    range_to_a1_cell,
+)
 from mygooglib.core.utils.base import BaseClient
-from mygooglib.core.utils.datetime import from_rfc3339, to_rfc3339
+from mygooglib.core.utils.datetime import (
+    from_rfc3339,
+    to_rfc3339,
+    to_rfc3339_many,
+)
 from mygooglib.core.utils.pagination import paginate
-from mygooglib.core.utils.retry import api_call, execute_with_retry_http_error
+from mygooglib.core.utils.retry import (
+    api_call,
+    clear_response_cache,
+    execute_with_retry_async,
+    execute_with_retry_http_error,
+)
 
 __all__ = [
     "col_to_a1",
     "a1_to_col",
     "range_to_a1",
+    "range_to_a1_cell",
+    "build_ranges",
     "to_rfc3339",
+    "to_rfc3339_many",
     "from_rfc3339",
     "paginate",
     "api_call",
     "execute_with_retry_http_error",
+    "execute_with_retry_async",
+    "clear_response_cache",
     "BaseClient",
 ]
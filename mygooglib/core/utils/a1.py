@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Iterable
+
+_NEEDS_QUOTES_RE = re.compile(r"[\s']")
 
 
 def col_to_a1(col: int) -> str:
@@ -106,6 +110,17 @@ def a1_to_range(
     return (sheet_name, start_row, start_col, end_row, end_col)
 
 
+@functools.lru_cache(maxsize=128)
+def _sheet_prefix(sheet_name: str | None) -> str:
+    """Return the quoted ``Sheet!`` prefix for a sheet name ('' for None)."""
+    if not sheet_name:
+        return ""
+    # Quote sheet name if it contains spaces or special chars
+    if _NEEDS_QUOTES_RE.search(sheet_name):
+        return f"'{sheet_name}'!"
+    return f"{sheet_name}!"
+
+
 def range_to_a1(
     sheet_name: str | None,
     start_row: int,
@@ -122,17 +137,57 @@ def range_to_a1(
         'A1:C10'
         >>> range_to_a1('Data', 1, 1, 10, 3)
         'Data!A1:C10'
+        >>> range_to_a1('My Data', 2, 2)
+        "'My Data'!B2"
     """
-    start = f"{col_to_a1(start_col)}{start_row}"
+    start_letters = col_to_a1(start_col)
     if end_row is None and end_col is None:
-        cell = start
+        cell = f"{start_letters}{start_row}"
     else:
-        end = f"{col_to_a1(end_col or start_col)}{end_row or start_row}"
-        cell = f"{start}:{end}"
-
-    if sheet_name:
-        # Quote sheet name if it contains spaces or special chars
-        if re.search(r"[\s']", sheet_name):
-            sheet_name = f"'{sheet_name}'"
-        return f"{sheet_name}!{cell}"
-    return cell
+        end_letters = col_to_a1(end_col) if end_col else start_letters
+        cell = f"{start_letters}{start_row}:{end_letters}{end_row or start_row}"
+    return _sheet_prefix(sheet_name) + cell
+
+
+def range_to_a1_cell(sheet_name: str | None, row: int, col: int) -> str:
+    """Build a single-cell A1 reference. Fast path for bulk callers.
+
+    Examples:
+        >>> range_to_a1_cell('Data', 3, 2)
+        'Data!B3'
+        >>> range_to_a1_cell(None, 1, 27)
+        'AA1'
+    """
+    return f"{_sheet_prefix(sheet_name)}{col_to_a1(col)}{row}"
+
+
+def build_ranges(
+    sheet_name: str | None,
+    specs: Iterable[tuple[int, int, int | None, int | None]],
+) -> list[str]:
+    """Build many A1 ranges on the same sheet (e.g. for batchGet).
+
+    The sheet prefix is computed once and reused for every range.
+
+    Args:
+        sheet_name: Sheet name shared by all ranges, or None.
+        specs: (start_row, start_col, end_row, end_col) tuples; pass None for
+            end_row/end_col to build a single-cell reference.
+
+    Examples:
+        >>> build_ranges('Data', [(1, 1, 10, 3), (2, 5, None, None)])
+        ['Data!A1:C10', 'Data!E2']
+    """
+    prefix = _sheet_prefix(sheet_name)
+    ranges: list[str] = []
+    append = ranges.append
+    for start_row, start_col, end_row, end_col in specs:
+        start_letters = col_to_a1(start_col)
+        if end_row is None and end_col is None:
+            append(f"{prefix}{start_letters}{start_row}")
+        else:
+            end_letters = col_to_a1(end_col) if end_col else start_letters
+            append(
+                f"{prefix}{start_letters}{start_row}:{end_letters}{end_row or start_row}"
+            )
+    return ranges
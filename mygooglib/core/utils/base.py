@@ -59,10 +59,31 @@ class BaseClient:
         """
         self.service = service
 
+    @property
+    def service(self) -> Any:
+        """The raw API service Resource this client wraps."""
+        return self._service
+
+    @service.setter
+    def service(self, service: Any) -> None:
+        # Attributes forwarded from the previous service must not outlive it.
+        for name in self.__dict__.pop("_forwarded", ()):
+            self.__dict__.pop(name, None)
+        self._service = service
+
     def __getattr__(self, name: str) -> Any:
         """Delegate attribute access to the underlying service resource.
-        
+
         This allows the wrapper to be used both with its ergonomic methods
         AND as a direct proxy to the Google API Discovery resource (e.g., drive.files()).
+
+        The forwarded attribute is cached on the instance until `service` is
+        reassigned, so later lookups bypass __getattr__ entirely.
         """
-        return getattr(self.service, name)
+        if name in ("_service", "_forwarded"):
+            # Not initialized yet (e.g. during copy/unpickling); avoid recursion.
+            raise AttributeError(name)
+        attr = getattr(self._service, name)
+        self.__dict__[name] = attr
+        self.__dict__.setdefault("_forwarded", set()).add(name)
+        return attr
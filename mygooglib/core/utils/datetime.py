@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime as dt
 import os
+from collections.abc import Iterable
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Default timezone for naive datetimes.
@@ -48,6 +49,19 @@ def to_rfc3339(value: dt.datetime | dt.date) -> str:
     return value.isoformat()
 
 
+def to_rfc3339_many(values: Iterable[dt.datetime | dt.date]) -> list[str]:
+    """Convert many dates/datetimes to RFC3339 strings.
+
+    Convenience for building large Calendar or Tasks payloads; equivalent to
+    ``[to_rfc3339(v) for v in values]``.
+
+    Examples:
+        >>> to_rfc3339_many([dt.date(2024, 1, 15), dt.date(2024, 1, 16)])
+        ['2024-01-15', '2024-01-16']
+    """
+    return [to_rfc3339(value) for value in values]
+
+
 def from_rfc3339(value: str) -> dt.datetime | dt.date:
     """Parse an RFC3339 string back to datetime or date.
 
@@ -56,8 +70,14 @@ def from_rfc3339(value: str) -> dt.datetime | dt.date:
         datetime.date(2024, 1, 15)
         >>> from_rfc3339('2024-01-15T10:30:00+00:00')
         datetime.datetime(2024, 1, 15, 10, 30, tzinfo=datetime.timezone.utc)
+        >>> from_rfc3339('2024-01-15T10:30:00Z')
+        datetime.datetime(2024, 1, 15, 10, 30, tzinfo=datetime.timezone.utc)
     """
     # All-day events come as 'YYYY-MM-DD'
-    if len(value) == 10:
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
         return dt.date.fromisoformat(value)
+    # Google commonly returns a trailing 'Z', which fromisoformat() rejects
+    # before Python 3.11.
+    if value[-1:] == "Z":
+        value = value[:-1] + "+00:00"
     return dt.datetime.fromisoformat(value)
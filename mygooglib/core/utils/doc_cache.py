@@ -0,0 +1,137 @@
+"""On-disk cache for Google Docs text, keyed by document revision.
+
+A document's plain text only changes when its revisionId changes, so a
+cached copy can be reused after a cheap `documents().get(fields="revisionId")`
+check instead of downloading the full body again.
+
+Entries live in a local SQLite database and are evicted least-recently-used
+once the stored text exceeds `max_size_bytes`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+# Default location: ~/.mygoog/doc_text_cache.db
+DEFAULT_DB_PATH = Path.home() / ".mygoog" / "doc_text_cache.db"
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+
+
+class DocTextCache:
+    """Local SQLite cache of document text per (doc_id, revision_id).
+
+    Only the latest cached revision of each document is kept.
+
+    Example:
+        >>> import tempfile
+        >>> cache = DocTextCache(tempfile.mktemp(suffix='.db'))
+        >>> cache.get('doc-1', 'rev-1') is None
+        True
+        >>> cache.put('doc-1', 'rev-1', 'Hello')
+        >>> cache.get('doc-1', 'rev-1')
+        'Hello'
+        >>> cache.get('doc-1', 'rev-2') is None
+        True
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        *,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database. Defaults to ~/.mygoog/doc_text_cache.db.
+            max_size_bytes: Upper bound on the total size of cached text.
+        """
+        if db_path is None:
+            db_path = DEFAULT_DB_PATH
+        self.db_path = Path(db_path)
+        self.max_size_bytes = max_size_bytes
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the database and table if they don't exist."""
+        if not self.db_path.parent.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS doc_text (
+                    doc_id TEXT PRIMARY KEY,
+                    revision_id TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+
+    def get(self, doc_id: str, revision_id: str) -> str | None:
+        """Return cached text for this exact revision, or None.
+
+        Args:
+            doc_id: Document ID.
+            revision_id: The document's current revisionId.
+
+        Returns:
+            The cached text, or None on a miss or stale revision.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT text FROM doc_text WHERE doc_id = ? AND revision_id = ?",
+                (doc_id, revision_id),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE doc_text SET last_used = ? WHERE doc_id = ?",
+                (time.time(), doc_id),
+            )
+            conn.commit()
+        return row[0]  # type: ignore[no-any-return]
+
+    def put(self, doc_id: str, revision_id: str, text: str) -> None:
+        """Store text for a revision, replacing any older revision.
+
+        Args:
+            doc_id: Document ID.
+            revision_id: The revisionId the text was read at.
+            text: The document's plain text.
+        """
+        size = len(text.encode("utf-8"))
+        if size > self.max_size_bytes:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO doc_text "
+                "(doc_id, revision_id, text, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (doc_id, revision_id, text, size, time.time()),
+            )
+            # Evict least-recently-used entries beyond the size budget.
+            conn.execute(
+                """
+                DELETE FROM doc_text WHERE doc_id IN (
+                    SELECT doc_id FROM (
+                        SELECT doc_id,
+                               SUM(size) OVER (ORDER BY last_used DESC) AS total
+                        FROM doc_text
+                    ) WHERE total > ?
+                )
+                """,
+                (self.max_size_bytes,),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM doc_text")
+            conn.commit()
@@ -1,4 +1,14 @@
 import os
+from collections.abc import Iterator
+from typing import NamedTuple
+
+
+class FileEntry(NamedTuple):
+    """Metadata for a single scanned file."""
+
+    filename: str
+    absolute_path: str
+    last_modified_timestamp: float
 
 
 class FileScanner:
@@ -6,7 +16,28 @@ class FileScanner:
     Utility to scan a directory and extract metadata for files.
     """
 
-    def scan(self, directory_path: str) -> list[dict]:
+    def scan_iter(self, directory_path: str) -> Iterator[FileEntry]:
+        """
+        Lazily yields metadata for each file in a directory (non-recursive).
+
+        Useful for streaming pipelines that should not materialize the full
+        listing up front.
+
+        Args:
+            directory_path: Absolute path to the directory.
+
+        Yields:
+            FileEntry records with 'filename', 'absolute_path', and 'last_modified_timestamp'.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        with os.scandir(directory_path) as it:
+            for entry in it:
+                if entry.is_file():
+                    yield FileEntry(entry.name, entry.path, entry.stat().st_mtime)
+
+    def scan(self, directory_path: str) -> list[FileEntry]:
         """
         Scans a directory (non-recursive) and returns metadata for all files.
 
@@ -14,23 +45,9 @@ class FileScanner:
             directory_path: Absolute path to the directory.
 
         Returns:
-            List of dictionaries containing 'filename', 'absolute_path', and 'last_modified_timestamp'.
+            List of FileEntry records with 'filename', 'absolute_path', and 'last_modified_timestamp'.
 
         Raises:
             FileNotFoundError: If the directory does not exist.
         """
-        if not os.path.exists(directory_path):
-            raise FileNotFoundError(f"The directory {directory_path} does not exist.")
-
-        results = []
-        for entry in os.scandir(directory_path):
-            if entry.is_file():
-                stats = entry.stat()
-                results.append(
-                    {
-                        "filename": entry.name,
-                        "absolute_path": entry.path,
-                        "last_modified_timestamp": stats.st_mtime,
-                    }
-                )
-        return results
+        return list(self.scan_iter(directory_path))
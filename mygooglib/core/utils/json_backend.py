@@ -0,0 +1,91 @@
+"""Pluggable JSON decoding for Google API responses.
+
+googleapiclient decodes every response body with the stdlib `json` module.
+For large payloads (e.g. Sheets batchGet on big ranges, full Gmail threads)
+a native parser such as `orjson` is noticeably faster.
+
+This is opt-in via env var and falls back to the stdlib when the requested
+backend is not installed:
+
+- MYGOOGLIB_JSON_BACKEND=orjson|ujson|json (default: json)
+
+Only decoding is swapped. Request bodies are still encoded with the stdlib,
+because `orjson.dumps` returns bytes rather than str.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+import googleapiclient.model
+
+from mygooglib.core.utils.logging import get_logger
+
+_STDLIB_JSON = googleapiclient.model.json
+
+
+class _JsonShim:
+    """Stands in for the `json` module inside googleapiclient.model."""
+
+    decoder = json.decoder
+    JSONDecodeError = json.JSONDecodeError
+    dumps = staticmethod(json.dumps)
+
+    def __init__(self, loads: Callable[[Any], Any]):
+        self.loads = loads
+
+
+def _load_backend(name: str) -> Callable[[Any], Any] | None:
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return None
+        # orjson.JSONDecodeError already subclasses json.JSONDecodeError.
+        return orjson.loads  # type: ignore[no-any-return]
+
+    if name == "ujson":
+        try:
+            import ujson
+        except ImportError:
+            return None
+
+        def _ujson_loads(content: Any) -> Any:
+            try:
+                return ujson.loads(content)
+            except ValueError as e:
+                # googleapiclient only catches json.JSONDecodeError.
+                raise json.JSONDecodeError(str(e), str(content), 0) from e
+
+        return _ujson_loads
+
+    return None
+
+
+def configure_json_backend(backend: str | None = None) -> str:
+    """Select the JSON decoder used for Google API responses.
+
+    Args:
+        backend: "orjson", "ujson" or "json". Defaults to the
+            MYGOOGLIB_JSON_BACKEND env var, then "json".
+
+    Returns:
+        The name of the backend actually in use ("json" if the requested
+        one is unavailable).
+    """
+    name = (backend or os.environ.get("MYGOOGLIB_JSON_BACKEND") or "json").lower()
+
+    loads = None if name == "json" else _load_backend(name)
+    if loads is None:
+        if name != "json":
+            get_logger("mygooglib.json").warning(
+                "JSON backend %r is not installed; using stdlib json", name
+            )
+        googleapiclient.model.json = _STDLIB_JSON  # type: ignore[attr-defined]
+        return "json"
+
+    googleapiclient.model.json = _JsonShim(loads)  # type: ignore[attr-defined]
+    return name
@@ -11,28 +11,45 @@ This module intentionally:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import os
 import random
+import threading
 import time
-from collections.abc import Iterable
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, cast
 
 from googleapiclient.errors import HttpError
 
 from mygooglib.core.utils.logging import get_logger
 
-_DEFAULT_RETRY_STATUSES: tuple[int, ...] = (429, 500, 502, 503, 504)
+_DEFAULT_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "y", "on"})
 
-def _env_bool(name: str, default: bool) -> bool:
-    value = os.environ.get(name)
+_RETRY_ENV_VARS: tuple[str, ...] = (
+    "MYGOOGLIB_RETRY_ENABLED",
+    "MYGOOGLIB_RETRY_ATTEMPTS_READ",
+    "MYGOOGLIB_RETRY_ATTEMPTS_WRITE",
+    "MYGOOGLIB_RETRY_INITIAL_BACKOFF_S",
+    "MYGOOGLIB_RETRY_MAX_BACKOFF_S",
+    "MYGOOGLIB_RETRY_JITTER",
+)
+
+_rand = random.random
+
+
+def _parse_bool(value: str | None, default: bool) -> bool:
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
-def _env_int(name: str, default: int) -> int:
-    value = os.environ.get(name)
+def _parse_int(value: str | None, default: int) -> int:
     if value is None:
         return default
     try:
@@ -41,8 +58,7 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
-def _env_float(name: str, default: float) -> float:
-    value = os.environ.get(name)
+def _parse_float(value: str | None, default: float) -> float:
     if value is None:
         return default
     try:
@@ -51,21 +67,178 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    return _parse_bool(os.environ.get(name), default)
+
+
+def _env_int(name: str, default: int) -> int:
+    return _parse_int(os.environ.get(name), default)
+
+
+def _env_float(name: str, default: float) -> float:
+    return _parse_float(os.environ.get(name), default)
+
+
+@dataclass(frozen=True)
+class _RetryConfig:
+    """Snapshot of the env-based retry defaults."""
+
+    enabled: bool
+    attempts_read: int
+    attempts_write: int
+    initial_backoff_s: float
+    max_backoff_s: float
+    jitter: bool
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_retry_cfg(raw: tuple[str | None, ...]) -> _RetryConfig:
+    enabled, attempts_read, attempts_write, initial_backoff, max_backoff, jitter = raw
+    return _RetryConfig(
+        enabled=_parse_bool(enabled, True),
+        attempts_read=_parse_int(attempts_read, 4),
+        attempts_write=_parse_int(attempts_write, 1),
+        initial_backoff_s=_parse_float(initial_backoff, 0.5),
+        max_backoff_s=_parse_float(max_backoff, 8.0),
+        jitter=_parse_bool(jitter, True),
+    )
+
+
+def _retry_cfg() -> _RetryConfig:
+    """Return the retry config for the current environment.
+
+    Parsing is cached on the raw env values, so changes to the environment
+    still take effect without re-parsing on every request.
+    """
+    environ = os.environ
+    return _resolve_retry_cfg(tuple(environ.get(name) for name in _RETRY_ENV_VARS))
+
+
 def _parse_retry_after_seconds(e: HttpError) -> float | None:
-    resp = getattr(e, "resp", None)
-    if resp is None:
-        return None
-    getter = getattr(resp, "get", None)
-    if not callable(getter):
+    # httplib2.Response lowercases header names, so one lookup is enough.
+    try:
+        return float(e.resp.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
         return None
 
-    raw = getter("retry-after") or getter("Retry-After")
-    if not raw:
-        return None
-    try:
-        return float(str(raw))
-    except (TypeError, ValueError):
+
+@functools.cache
+def _retry_logger() -> logging.Logger:
+    # Resolved lazily (not at import) so env-based logging config still applies.
+    return get_logger("mygooglib.retry")
+
+
+def _http_status(e: HttpError) -> int:
+    return int(getattr(getattr(e, "resp", None), "status", 0) or 0)
+
+
+def _retry_delay(
+    e: HttpError,
+    status: int,
+    attempt: int,
+    effective_attempts: int,
+    is_write: bool,
+    initial_backoff_s: float,
+    max_backoff_s: float,
+    jitter: bool,
+) -> float:
+    retry_after_s = _parse_retry_after_seconds(e)
+
+    # Exponential backoff with a small jitter (or honor Retry-After when present).
+    backoff = (
+        retry_after_s
+        if retry_after_s is not None
+        else min(max_backoff_s, initial_backoff_s * (2 ** (attempt - 1)))
+    )
+    if jitter:
+        backoff *= 0.85 + _rand() * 0.30
+
+    sleep_s = max(0.0, backoff)
+    logger = _retry_logger()
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Retrying after HTTP %s (attempt %s/%s, write=%s, sleep=%.2fs)",
+            status,
+            attempt,
+            effective_attempts,
+            is_write,
+            sleep_s,
+        )
+    return sleep_s
+
+
+def _sleep_before_retry(
+    e: HttpError,
+    status: int,
+    attempt: int,
+    effective_attempts: int,
+    is_write: bool,
+    initial_backoff_s: float,
+    max_backoff_s: float,
+    jitter: bool,
+) -> None:
+    time.sleep(
+        _retry_delay(
+            e,
+            status,
+            attempt,
+            effective_attempts,
+            is_write,
+            initial_backoff_s,
+            max_backoff_s,
+            jitter,
+        )
+    )
+
+
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache: OrderedDict[tuple[Any, ...], tuple[Any, float]] = OrderedDict()
+_response_cache_lock = threading.Lock()
+_CACHE_MISS = object()
+
+
+def _response_cache_key(request: Any) -> tuple[Any, ...] | None:
+    uri = getattr(request, "uri", None)
+    if uri is None:
         return None
+    # The same URI means different data for different accounts, so responses
+    # are only shared between requests authorized with the same credentials
+    # (per-thread Http clones of one service keep sharing them).
+    http = getattr(request, "http", None)
+    identity = id(getattr(http, "credentials", http))
+    return (
+        identity,
+        uri,
+        getattr(request, "method", None),
+        getattr(request, "body", None),
+    )
+
+
+def _response_cache_get(key: tuple[Any, ...]) -> Any:
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del _response_cache[key]
+            return _CACHE_MISS
+        _response_cache.move_to_end(key)
+        return value
+
+
+def _response_cache_put(key: tuple[Any, ...], value: Any, ttl_s: float) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = (value, time.monotonic() + ttl_s)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    """Drop all responses cached via execute_with_retry_http_error(cache_ttl_s=...)."""
+    with _response_cache_lock:
+        _response_cache.clear()
 
 
 def execute_with_retry_http_error(
@@ -76,6 +249,7 @@ def execute_with_retry_http_error(
     initial_backoff_s: float | None = None,
     max_backoff_s: float | None = None,
     retry_statuses: Iterable[int] = _DEFAULT_RETRY_STATUSES,
+    cache_ttl_s: float | None = None,
 ) -> Any:
     """Execute a request, retrying transient HttpError statuses.
 
@@ -103,6 +277,10 @@ def execute_with_retry_http_error(
         initial_backoff_s: Initial backoff time in seconds
         max_backoff_s: Maximum backoff time in seconds
         retry_statuses: HTTP status codes to retry (default: 429, 500, 502, 503, 504)
+        cache_ttl_s: Opt-in for reads only. Reuse the response of an identical
+            request (same URI, method and body) for this many seconds instead
+            of hitting the network. Cached responses may be stale and are
+            shared objects, so don't mutate them. Ignored when is_write=True.
 
     Returns:
         The API response from request.execute()
@@ -111,68 +289,264 @@ def execute_with_retry_http_error(
         HttpError: If all retry attempts are exhausted or status is not retryable
     """
 
-    retry_enabled = _env_bool("MYGOOGLIB_RETRY_ENABLED", True)
+    if cache_ttl_s is not None and not is_write:
+        key = _response_cache_key(request)
+        if key is not None:
+            cached = _response_cache_get(key)
+            if cached is not _CACHE_MISS:
+                return cached
+            result = execute_with_retry_http_error(
+                request,
+                attempts=attempts,
+                initial_backoff_s=initial_backoff_s,
+                max_backoff_s=max_backoff_s,
+                retry_statuses=retry_statuses,
+            )
+            _response_cache_put(key, result, cache_ttl_s)
+            return result
 
-    attempts_read = _env_int("MYGOOGLIB_RETRY_ATTEMPTS_READ", 4)
-    attempts_write = _env_int("MYGOOGLIB_RETRY_ATTEMPTS_WRITE", 1)
+    cfg = _retry_cfg()
 
-    initial_backoff_s = (
-        initial_backoff_s
-        if initial_backoff_s is not None
-        else _env_float("MYGOOGLIB_RETRY_INITIAL_BACKOFF_S", 0.5)
-    )
-    max_backoff_s = (
-        max_backoff_s
-        if max_backoff_s is not None
-        else _env_float("MYGOOGLIB_RETRY_MAX_BACKOFF_S", 8.0)
-    )
+    if initial_backoff_s is None:
+        initial_backoff_s = cfg.initial_backoff_s
+    if max_backoff_s is None:
+        max_backoff_s = cfg.max_backoff_s
 
     effective_attempts = attempts
     if effective_attempts is None:
-        effective_attempts = attempts_write if is_write else attempts_read
-    if not retry_enabled:
+        effective_attempts = cfg.attempts_write if is_write else cfg.attempts_read
+    if not cfg.enabled:
         effective_attempts = 1
 
     if effective_attempts < 1:
         raise ValueError("attempts must be >= 1")
 
-    retry_set = set(int(s) for s in retry_statuses)
+    # Fast path: no retries configured, nothing to wrap.
+    if effective_attempts == 1:
+        return request.execute()
 
-    logger = get_logger("mygooglib.retry")
+    retry_set = (
+        retry_statuses
+        if isinstance(retry_statuses, frozenset)
+        else frozenset(int(s) for s in retry_statuses)
+    )
 
-    for attempt in range(1, effective_attempts + 1):
+    # First attempt is kept outside the loop so the common success case stays flat.
+    try:
+        return request.execute()
+    except HttpError as e:
+        status = _http_status(e)
+        if status not in retry_set:
+            raise
+        _sleep_before_retry(
+            e,
+            status,
+            1,
+            effective_attempts,
+            is_write,
+            initial_backoff_s,
+            max_backoff_s,
+            cfg.jitter,
+        )
+
+    for attempt in range(2, effective_attempts + 1):
         try:
             return request.execute()
         except HttpError as e:
-            status = int(getattr(getattr(e, "resp", None), "status", 0) or 0)
+            status = _http_status(e)
             if attempt >= effective_attempts or status not in retry_set:
                 raise
-
-            retry_after_s = _parse_retry_after_seconds(e)
-
-            # Exponential backoff with a small jitter (or honor Retry-After when present).
-            backoff = (
-                retry_after_s
-                if retry_after_s is not None
-                else min(max_backoff_s, initial_backoff_s * (2 ** (attempt - 1)))
-            )
-            jitter = random.uniform(0.85, 1.15)
-
-            sleep_s = max(0.0, backoff * jitter)
-            logger.warning(
-                "Retrying after HTTP %s (attempt %s/%s, write=%s, sleep=%.2fs)",
+            _sleep_before_retry(
+                e,
                 status,
                 attempt,
                 effective_attempts,
                 is_write,
-                sleep_s,
+                initial_backoff_s,
+                max_backoff_s,
+                cfg.jitter,
             )
-            time.sleep(sleep_s)
 
     # Unreachable
     raise AssertionError("execute_with_retry_http_error: fell through")
 
 
+async def execute_with_retry_async(
+    request: Any,
+    *,
+    is_write: bool = False,
+    attempts: int | None = None,
+    initial_backoff_s: float | None = None,
+    max_backoff_s: float | None = None,
+    retry_statuses: Iterable[int] = _DEFAULT_RETRY_STATUSES,
+) -> Any:
+    """Async counterpart of execute_with_retry_http_error.
+
+    Each attempt runs request.execute() in a worker thread, and backoff waits
+    use asyncio.sleep, so a request that is rate-limited does not hold a
+    thread while it waits. Independent requests can be awaited together with
+    asyncio.gather.
+
+    httplib2 is not thread-safe: requests awaited concurrently must not share
+    an Http object (use separate service Resources, or set request.http).
+
+    Args:
+        request: The API request object to execute
+        is_write: Whether this is a write operation (affects default retry behavior)
+        attempts: Number of attempts (overrides env-based defaults)
+        initial_backoff_s: Initial backoff time in seconds
+        max_backoff_s: Maximum backoff time in seconds
+        retry_statuses: HTTP status codes to retry (default: 429, 500, 502, 503, 504)
+
+    Returns:
+        The API response from request.execute()
+
+    Raises:
+        HttpError: If all retry attempts are exhausted or status is not retryable
+    """
+    cfg = _retry_cfg()
+
+    if initial_backoff_s is None:
+        initial_backoff_s = cfg.initial_backoff_s
+    if max_backoff_s is None:
+        max_backoff_s = cfg.max_backoff_s
+
+    effective_attempts = attempts
+    if effective_attempts is None:
+        effective_attempts = cfg.attempts_write if is_write else cfg.attempts_read
+    if not cfg.enabled:
+        effective_attempts = 1
+
+    if effective_attempts < 1:
+        raise ValueError("attempts must be >= 1")
+
+    retry_set = frozenset(int(s) for s in retry_statuses)
+
+    for attempt in range(1, effective_attempts + 1):
+        try:
+            return await asyncio.to_thread(request.execute)
+        except HttpError as e:
+            status = _http_status(e)
+            if attempt >= effective_attempts or status not in retry_set:
+                raise
+            await asyncio.sleep(
+                _retry_delay(
+                    e,
+                    status,
+                    attempt,
+                    effective_attempts,
+                    is_write,
+                    initial_backoff_s,
+                    max_backoff_s,
+                    cfg.jitter,
+                )
+            )
+
+    # Unreachable
+    raise AssertionError("execute_with_retry_async: fell through")
+
+
+# Google's batch endpoints accept at most 100 calls per HTTP request.
+BATCH_LIMIT = 100
+
+
+def execute_batch_with_retry(
+    service: Any,
+    requests: Mapping[str, Any],
+    *,
+    is_write: bool = False,
+    attempts: int | None = None,
+    initial_backoff_s: float | None = None,
+    max_backoff_s: float | None = None,
+    retry_statuses: Iterable[int] = _DEFAULT_RETRY_STATUSES,
+    batch_limit: int = BATCH_LIMIT,
+) -> tuple[dict[str, Any], dict[str, Exception]]:
+    """Execute many requests through the service's batch endpoint.
+
+    Requests are sent in chunks of at most `batch_limit` via
+    service.new_batch_http_request(). Sub-requests that fail with a
+    retryable status are re-submitted (only those, not the whole batch)
+    using the same attempt/backoff policy as execute_with_retry_http_error.
+
+    Args:
+        service: Discovery Resource exposing new_batch_http_request()
+        requests: Mapping of unique request_id -> API request object
+        is_write: Whether these are write operations (affects default retries)
+        attempts: Number of attempts per sub-request (overrides env defaults)
+        initial_backoff_s: Initial backoff time in seconds
+        max_backoff_s: Maximum backoff time in seconds
+        retry_statuses: HTTP status codes to retry
+        batch_limit: Maximum calls per batch HTTP request
+
+    Returns:
+        Tuple of (responses, errors), both keyed by request_id. Every
+        request_id ends up in exactly one of the two dicts.
+    """
+    cfg = _retry_cfg()
+    if initial_backoff_s is None:
+        initial_backoff_s = cfg.initial_backoff_s
+    if max_backoff_s is None:
+        max_backoff_s = cfg.max_backoff_s
+    effective_attempts = attempts
+    if effective_attempts is None:
+        effective_attempts = cfg.attempts_write if is_write else cfg.attempts_read
+    if not cfg.enabled:
+        effective_attempts = 1
+    if effective_attempts < 1:
+        raise ValueError("attempts must be >= 1")
+
+    retry_set = (
+        retry_statuses
+        if isinstance(retry_statuses, frozenset)
+        else frozenset(int(s) for s in retry_statuses)
+    )
+
+    results: dict[str, Any] = {}
+    errors: dict[str, Exception] = {}
+
+    def _callback(request_id: str, response: Any, exception: Exception | None) -> None:
+        if exception is None:
+            results[request_id] = response
+        else:
+            errors[request_id] = exception
+
+    pending = list(requests)
+    for attempt in range(1, effective_attempts + 1):
+        for start in range(0, len(pending), batch_limit):
+            batch = service.new_batch_http_request()
+            for request_id in pending[start : start + batch_limit]:
+                batch.add(
+                    requests[request_id], callback=_callback, request_id=request_id
+                )
+            # Transport-level failures of the batch call itself use the normal policy.
+            execute_with_retry_http_error(batch, is_write=is_write)
+
+        retryable: list[str] = []
+        for request_id in pending:
+            error = errors.get(request_id)
+            if isinstance(error, HttpError) and _http_status(error) in retry_set:
+                retryable.append(request_id)
+        if not retryable or attempt >= effective_attempts:
+            break
+
+        first_error = cast(HttpError, errors[retryable[0]])
+        _sleep_before_retry(
+            first_error,
+            _http_status(first_error),
+            attempt,
+            effective_attempts,
+            is_write,
+            initial_backoff_s,
+            max_backoff_s,
+            cfg.jitter,
+        )
+        for request_id in retryable:
+            del errors[request_id]
+        pending = retryable
+
+    return results, errors
+
+
 def api_call(context: str, *, is_write: bool = False) -> Any:
     """Decorator that wraps API calls with retry and error handling.
 
@@ -6,12 +6,22 @@ They return plain Python types by default, with a `raw=True` escape hatch.
 
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 from mygooglib.core.utils.base import BaseClient
-from mygooglib.core.utils.retry import api_call, execute_with_retry_http_error
+from mygooglib.core.utils.doc_cache import DocTextCache
+from mygooglib.core.utils.retry import (
+    api_call,
+    execute_batch_with_retry,
+    execute_with_retry_http_error,
+)
+
+# Partial response for get_text: only the text runs, not styles or ranges.
+_TEXT_FIELDS = "body/content(paragraph/elements/textRun/content)"
 
 
 @api_call("Docs create", is_write=True)
@@ -41,47 +51,84 @@ def get_text(docs: Any, doc_id: str) -> str:
     Returns:
         Full plain text content of the document.
     """
-    request = docs.documents().get(documentId=doc_id)
+    request = docs.documents().get(documentId=doc_id, fields=_TEXT_FIELDS)
     response = execute_with_retry_http_error(request, is_write=False)
+    return _extract_text(response)
+
 
+def _extract_text(response: dict) -> str:
+    """Concatenate the paragraph text runs of a documents().get response."""
     content = response.get("body", {}).get("content", [])
-    text_parts = []
-    for element in content:
-        if "paragraph" in element:
-            for part in element["paragraph"]["elements"]:
-                if "textRun" in part:
-                    text_parts.append(part["textRun"]["content"])
-    return "".join(text_parts)
+    return "".join(
+        part["textRun"]["content"]
+        for element in content
+        if "paragraph" in element
+        for part in element["paragraph"]["elements"]
+        if "textRun" in part
+    )
+
+
+@functools.cache
+def _default_text_cache() -> DocTextCache:
+    """Return the process-wide DocTextCache used when get_text_cached gets none."""
+    return DocTextCache()
+
+
+@api_call("Docs get_text_cached", is_write=False)
+def get_text_cached(
+    docs: Any, doc_id: str, *, cache: DocTextCache | None = None
+) -> str:
+    """Get all plain text from a document, reusing an on-disk copy if current.
+
+    Fetches only the document's revisionId first; the full body is
+    downloaded only when that revision isn't cached yet.
+
+    The default cache stores the document's plain text unencrypted in
+    ~/.mygoog/doc_text_cache.db (up to 512 MB across documents). Call
+    get_text instead to keep document contents off disk, or pass a cache
+    with a different location or size limit.
+
+    Args:
+        docs: Docs API Resource
+        doc_id: Document ID
+        cache: Cache to use. Defaults to a shared DocTextCache() at
+            ~/.mygoog/doc_text_cache.db.
+
+    Returns:
+        Full plain text content of the document.
+    """
+    store = cache if cache is not None else _default_text_cache()
+    request = docs.documents().get(documentId=doc_id, fields="revisionId")
+    revision_id = execute_with_retry_http_error(request, is_write=False)["revisionId"]
+
+    text = store.get(doc_id, revision_id)
+    if text is not None:
+        return text
+
+    # Re-read the revisionId with the body so the text is stored under the
+    # revision it was actually read at.
+    request = docs.documents().get(
+        documentId=doc_id, fields=f"revisionId,{_TEXT_FIELDS}"
+    )
+    response = execute_with_retry_http_error(request, is_write=False)
+    text = _extract_text(response)
+    store.put(doc_id, response.get("revisionId", revision_id), text)
+    return text
 
 
 @api_call("Docs append_text", is_write=True)
 def append_text(docs: Any, doc_id: str, text: str) -> None:
     """Append text to the end of a document.
 
+    Uses endOfSegmentLocation so Docs resolves the end of the body
+    server-side; no read is needed to find the end index.
+
     Args:
         docs: Docs API Resource
         doc_id: Document ID
         text: Text to append
     """
-    # Fetch current content to find the end index
-    request = docs.documents().get(documentId=doc_id, fields="body/content")
-    response = execute_with_retry_http_error(request, is_write=False)
-    content = response.get("body", {}).get("content", [])
-
-    # The last element's endIndex (minus 1 for the trailing newline) is usually the end.
-    if not content:
-        end_index = 1
-    else:
-        end_index = content[-1]["endIndex"] - 1
-
-    requests = [
-        {
-            "insertText": {
-                "location": {"index": max(1, end_index)},
-                "text": text,
-            }
-        }
-    ]
+    requests = [{"insertText": {"endOfSegmentLocation": {}, "text": text}}]
     update_request = docs.documents().batchUpdate(
         documentId=doc_id, body={"requests": requests}
     )
@@ -118,24 +165,14 @@ def render_template(
 
     # 1. Copy the template using Drive API
     copy_metadata = {"name": title} if title else {}
-    copy_request = drive.files().copy(fileId=template_id, body=copy_metadata)
+    copy_request = drive.files().copy(
+        fileId=template_id, body=copy_metadata, fields=None if raw else "id"
+    )
     new_doc = execute_with_retry_http_error(copy_request, is_write=True)
     new_doc_id = new_doc["id"]
 
     # 2. Perform find-and-replace using Docs API
-    requests = []
-    for key, value in data.items():
-        requests.append(
-            {
-                "replaceAllText": {
-                    "containsText": {
-                        "text": "{{" + key + "}}",
-                        "matchCase": True,
-                    },
-                    "replaceText": str(value),
-                }
-            }
-        )
+    requests = _replace_all_text_requests(data)
 
     if not requests:
         return new_doc if raw else new_doc_id  # type: ignore[no-any-return]
@@ -148,6 +185,84 @@ def render_template(
     return response if raw else new_doc_id  # type: ignore[no-any-return]
 
 
+@functools.lru_cache(maxsize=64)
+def _placeholder_matchers(keys: tuple[str, ...]) -> tuple[dict, ...]:
+    """Build the containsText part of each placeholder once per key set.
+
+    The dicts are shared between calls and only ever serialized, never
+    mutated.
+    """
+    return tuple({"text": "{{" + key + "}}", "matchCase": True} for key in keys)
+
+
+def _replace_all_text_requests(data: dict[str, str]) -> list[dict]:
+    """Build replaceAllText requests for {{key}} placeholders (internal helper)."""
+    matchers = _placeholder_matchers(tuple(data))
+    return [
+        {"replaceAllText": {"containsText": matcher, "replaceText": str(value)}}
+        for matcher, value in zip(matchers, data.values())
+    ]
+
+
+@api_call("Docs render_templates_bulk", is_write=True)
+def render_templates_bulk(
+    docs: Any,
+    drive: Any,
+    jobs: Sequence[dict[str, Any]],
+) -> list[str]:
+    """Render many templates using batched HTTP requests.
+
+    Equivalent to calling render_template once per job, but all template
+    copies go out as Drive batch requests and all placeholder replacements
+    as Docs batch requests (up to 100 calls per HTTP round-trip). Only
+    sub-requests that fail with a retryable status are re-sent.
+
+    Args:
+        docs: Docs API Resource from get_clients().docs
+        drive: Drive API Resource (required to copy the templates)
+        jobs: Dicts with keys 'template_id', 'data' and optional 'title'
+
+    Returns:
+        New document IDs, in the same order as jobs.
+
+    Raises:
+        GoogleApiError: If any copy or update fails. Documents copied
+            before the failure are left in place.
+    """
+    if not jobs:
+        return []
+
+    copy_requests: dict[str, Any] = {}
+    for i, job in enumerate(jobs):
+        title = job.get("title")
+        copy_requests[str(i)] = drive.files().copy(
+            fileId=job["template_id"],
+            body={"name": title} if title else {},
+            fields="id",
+        )
+    copies, copy_errors = execute_batch_with_retry(drive, copy_requests, is_write=True)
+    if copy_errors:
+        raise next(iter(copy_errors.values()))
+
+    new_doc_ids = [copies[str(i)]["id"] for i in range(len(jobs))]
+
+    update_requests: dict[str, Any] = {}
+    for i, job in enumerate(jobs):
+        requests = _replace_all_text_requests(job.get("data") or {})
+        if requests:
+            update_requests[str(i)] = docs.documents().batchUpdate(
+                documentId=new_doc_ids[i], body={"requests": requests}
+            )
+    if update_requests:
+        _, update_errors = execute_batch_with_retry(
+            docs, update_requests, is_write=True
+        )
+        if update_errors:
+            raise next(iter(update_errors.values()))
+
+    return new_doc_ids
+
+
 def export_pdf(
     drive: Any,
     doc_id: str,
@@ -398,6 +513,12 @@ class DocsClient(BaseClient):
             raw=raw,
         )
 
+    def render_templates_bulk(self, jobs: Sequence[dict[str, Any]]) -> list[str]:
+        """Render many templates using batched HTTP requests."""
+        if self.drive is None:
+            raise ValueError("drive=clients.drive is required to copy the template.")
+        return render_templates_bulk(self.service, self.drive, jobs)  # type: ignore[no-any-return]
+
     def export_pdf(
         self,
         doc_id: str,
@@ -416,6 +537,10 @@ class DocsClient(BaseClient):
         """Get all plain text from a document."""
         return get_text(self.service, doc_id)  # type: ignore[no-any-return]
 
+    def get_text_cached(self, doc_id: str, *, cache: DocTextCache | None = None) -> str:
+        """Get all plain text from a document, reusing an on-disk copy if current."""
+        return get_text_cached(self.service, doc_id, cache=cache)  # type: ignore[no-any-return]
+
     def append_text(self, doc_id: str, text: str) -> None:
         """Append text to the end of a document."""
         return append_text(self.service, doc_id, text)  # type: ignore[no-any-return]
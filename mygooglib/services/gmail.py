@@ -6,24 +6,88 @@ They return plain Python types by default, with a `raw=True` escape hatch.
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import copy
+import functools
+import json
 import mimetypes
+import os
+import threading
+from collections import OrderedDict, deque
 from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.message import EmailMessage
 from pathlib import Path
 from typing import Any, cast
 
+import google_auth_httplib2
+import httplib2
+
 from mygooglib.core.types import (
     AttachmentMetadataDict,
     LabelDict,
     MessageDict,
     MessageFullDict,
     MessageMetadataDict,
+    MessageMetadataTable,
     SendMessageResponseDict,
 )
 from mygooglib.core.utils.base import BaseClient
+from mygooglib.core.utils.idempotency import IdempotencyStore
 from mygooglib.core.utils.retry import api_call, execute_with_retry_http_error
 
+# SIMD base64 for large attachments when mygooglib[speedups] is installed.
+try:
+    from pybase64 import urlsafe_b64decode, urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+# Gmail rejects batch requests with more than 100 calls.
+_BATCH_MAX_CALLS = 100
+
+# users.messages.batchModify accepts at most 1000 ids per call.
+_BATCH_MODIFY_MAX_IDS = 1000
+
+# Headers fetched for search results. Must stay a list: googleapiclient only
+# expands repeated query parameters when given exactly a list.
+_METADATA_HEADERS = ["From", "To", "Subject", "Date"]
+
+# Base64 characters decoded per write when streaming an attachment to disk;
+# a multiple of 4 so every slice decodes on its own.
+_ATTACHMENT_DECODE_CHUNK = 64 * 1024
+
+_thread_local = threading.local()
+
+# Recently read attachment files, keyed by (path, mtime_ns, size) so an edited
+# file is read again. Bounded by total bytes rather than entry count.
+_ATTACHMENT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_attachment_cache: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+_attachment_cache_bytes = 0
+_attachment_cache_lock = threading.Lock()
+
+
+def _thread_gmail(gmail: Any) -> Any:
+    """Return a per-thread copy of the Gmail Resource with its own Http.
+
+    httplib2.Http is not thread-safe, so worker threads must not share the
+    Resource's default Http (same approach as drive._thread_drive).
+    """
+    cached = getattr(_thread_local, "gmail", None)
+    if cached is not None and cached[0] is gmail:
+        return cached[1]
+
+    clone = copy.copy(gmail)
+    clone._http = google_auth_httplib2.AuthorizedHttp(
+        gmail._http.credentials, http=httplib2.Http()
+    )
+    _thread_local.gmail = (gmail, clone)
+    return clone
+
+
+def _in_worker_thread(func: Any, gmail: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a Gmail helper against this thread's own Resource clone."""
+    return func(_thread_gmail(gmail), *args, **kwargs)
+
 
 def _as_address_list(value: str | Sequence[str] | None) -> str | None:
     """Convert email address(es) to comma-separated string (internal helper).
@@ -38,9 +102,25 @@ def _as_address_list(value: str | Sequence[str] | None) -> str | None:
         return None
     if isinstance(value, str):
         return value
+    if len(value) == 1:
+        return value[0]
     return ", ".join(value)
 
 
+def _split_mime(mime: str | None) -> tuple[str, str]:
+    """Split a MIME type into (maintype, subtype), defaulting to octet-stream."""
+    if not mime or "/" not in mime:
+        return "application", "octet-stream"
+    maintype, subtype = mime.split("/", 1)
+    return maintype, subtype
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime_by_ext(ext: str) -> tuple[str, str]:
+    """Guess (maintype, subtype) for a lowercased file suffix (internal helper)."""
+    return _split_mime(mimetypes.guess_type(f"file{ext}")[0])
+
+
 def _guess_mime(path: Path) -> tuple[str, str]:
     """Guess MIME type from file path (internal helper).
 
@@ -50,11 +130,82 @@ def _guess_mime(path: Path) -> tuple[str, str]:
     Returns:
         Tuple of (maintype, subtype) for MIME type, e.g. ('application', 'pdf')
     """
-    mime = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
-    if "/" not in mime:
-        return "application", "octet-stream"
-    maintype, subtype = mime.split("/", 1)
-    return maintype, subtype
+    suffix = path.suffix.lower()
+    if suffix in mimetypes.encodings_map:
+        # Compound names such as "x.tar.gz" need the whole name.
+        return _split_mime(mimetypes.guess_type(str(path))[0])
+    return _guess_mime_by_ext(suffix)
+
+
+def _read_attachment(path: Path) -> bytes:
+    """Read an attachment file, reusing recent reads of unchanged files (internal helper)."""
+    global _attachment_cache_bytes
+    st = path.stat()
+    key = (os.fspath(path.absolute()), st.st_mtime_ns, st.st_size)
+    with _attachment_cache_lock:
+        data = _attachment_cache.get(key)
+        if data is not None:
+            _attachment_cache.move_to_end(key)
+            return data
+
+    data = path.read_bytes()
+    if len(data) <= _ATTACHMENT_CACHE_MAX_BYTES:
+        with _attachment_cache_lock:
+            if key not in _attachment_cache:
+                _attachment_cache[key] = data
+                _attachment_cache_bytes += len(data)
+                while _attachment_cache_bytes > _ATTACHMENT_CACHE_MAX_BYTES:
+                    _, evicted = _attachment_cache.popitem(last=False)
+                    _attachment_cache_bytes -= len(evicted)
+    return data
+
+
+def _build_message(
+    *,
+    to: str | Sequence[str],
+    subject: str,
+    body: str,
+    attachments: Sequence[str | Path] | None,
+    cc: str | Sequence[str] | None,
+    bcc: str | Sequence[str] | None,
+) -> EmailMessage:
+    """Assemble a plain-text MIME message with attachments (internal helper)."""
+    msg = EmailMessage()
+    msg["To"] = _as_address_list(to)
+    msg["Subject"] = subject
+    cc_value = _as_address_list(cc)
+    if cc_value:
+        msg["Cc"] = cc_value
+    bcc_value = _as_address_list(bcc)
+    if bcc_value:
+        msg["Bcc"] = bcc_value
+    msg.set_content(body)
+
+    paths = [
+        item if isinstance(item, Path) else Path(item) for item in attachments or ()
+    ]
+    for path in paths:
+        try:
+            # The stat inside _read_attachment doubles as the existence check.
+            data = _read_attachment(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Attachment not found: {path}") from None
+        maintype, subtype = _guess_mime(path)
+        msg.add_attachment(data, maintype=maintype, subtype=subtype, filename=path.name)
+    return msg
+
+
+def _send_message(gmail: Any, msg: EmailMessage, *, user_id: str) -> dict:
+    """Encode and send a built message (internal helper)."""
+    encoded = urlsafe_b64encode(msg.as_bytes()).decode("ascii")
+    request = gmail.users().messages().send(userId=user_id, body={"raw": encoded})
+    return execute_with_retry_http_error(request, is_write=True)  # type: ignore[no-any-return]
+
+
+@functools.cache
+def _idempotency_store() -> IdempotencyStore:
+    """Return the process-wide store of send_email idempotency keys."""
+    return IdempotencyStore()
 
 
 @api_call("Gmail send_email", is_write=True)
@@ -93,42 +244,18 @@ def send_email(
     """
     # Check idempotency if key provided
     if idempotency_key:
-        from mygooglib.core.utils.idempotency import IdempotencyStore
-
-        store = IdempotencyStore()
+        store = _idempotency_store()
         if store.check(idempotency_key):
             # Already processed, skip sending
             return None
 
-    msg = EmailMessage()
-    msg["To"] = _as_address_list(to)
-    msg["Subject"] = subject
-    cc_value = _as_address_list(cc)
-    if cc_value:
-        msg["Cc"] = cc_value
-    bcc_value = _as_address_list(bcc)
-    if bcc_value:
-        msg["Bcc"] = bcc_value
-    msg.set_content(body)
-
-    for item in attachments or []:
-        path = item if isinstance(item, Path) else Path(item)
-        if not path.exists():
-            raise FileNotFoundError(f"Attachment not found: {path}")
-        data = path.read_bytes()
-        maintype, subtype = _guess_mime(path)
-        msg.add_attachment(data, maintype=maintype, subtype=subtype, filename=path.name)
-
-    encoded = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
-    payload = {"raw": encoded}
-
-    request = gmail.users().messages().send(userId=user_id, body=payload)
-    response = execute_with_retry_http_error(request, is_write=True)
+    msg = _build_message(
+        to=to, subject=subject, body=body, attachments=attachments, cc=cc, bcc=bcc
+    )
+    response = _send_message(gmail, msg, user_id=user_id)
 
     # Record successful send if idempotency key was provided
     if idempotency_key:
-        import json
-
         metadata = json.dumps({"message_id": response.get("id")})
         store.add(idempotency_key, metadata=metadata)
 
@@ -139,6 +266,56 @@ def send_email(
     )
 
 
+@api_call("Gmail send_email_bulk", is_write=True)
+def send_email_bulk(
+    gmail: Any,
+    *,
+    to_list: Sequence[str | Sequence[str]],
+    subject: str,
+    body: str,
+    attachments: Sequence[str | Path] | None = None,
+    cc: str | Sequence[str] | None = None,
+    bcc: str | Sequence[str] | None = None,
+    user_id: str = "me",
+) -> list[str]:
+    """Send the same email separately to each recipient (mail-merge style).
+
+    The MIME body and attachments are built once; only the To header
+    changes between sends. Messages are sent in order, so if one send
+    fails, the earlier ones have already gone out.
+
+    Args:
+        gmail: Gmail API Resource from get_clients().gmail
+        to_list: One entry per message; each is an email or list of emails
+        subject: Subject line
+        body: Plain text body
+        attachments: Optional list of file paths, read once for all sends
+        cc: Optional CC email(s) added to every message
+        bcc: Optional BCC email(s) added to every message
+        user_id: Gmail userId (default "me")
+
+    Returns:
+        Message IDs, in the order of to_list.
+    """
+    if not to_list:
+        return []
+
+    msg = _build_message(
+        to=to_list[0],
+        subject=subject,
+        body=body,
+        attachments=attachments,
+        cc=cc,
+        bcc=bcc,
+    )
+    message_ids: list[str] = []
+    for to in to_list:
+        msg.replace_header("To", _as_address_list(to))
+        response = _send_message(gmail, msg, user_id=user_id)
+        message_ids.append(cast(str, response.get("id")))
+    return message_ids
+
+
 def _headers_to_dict(headers: Iterable[dict[str, str]] | None) -> dict[str, str]:
     """Convert Gmail API headers list to a normalized dict (internal helper).
 
@@ -148,13 +325,11 @@ def _headers_to_dict(headers: Iterable[dict[str, str]] | None) -> dict[str, str]
     Returns:
         Dict mapping lowercase header names to values
     """
-    result: dict[str, str] = {}
-    for header in headers or []:
-        name = (header.get("name") or "").strip()
-        value = (header.get("value") or "").strip()
-        if name:
-            result[name.lower()] = value
-    return result
+    return {
+        name.lower(): (header.get("value") or "").strip()
+        for header in headers or ()
+        if (name := (header.get("name") or "").strip())
+    }
 
 
 @api_call("Gmail list_labels", is_write=False)
@@ -198,6 +373,7 @@ def search_messages(
     include_spam_trash: bool = False,
     raw: bool = False,
     progress_callback: Any | None = None,
+    legacy_sender_field: bool = True,
 ) -> list[MessageMetadataDict] | dict:
     """Search Gmail and return lightweight message dicts.
 
@@ -209,9 +385,13 @@ def search_messages(
             include_spam_trash: Include spam and trash
             raw: If True, return the raw list() response for the first page
             progress_callback: Optional callable(current_count, total_count)
+            legacy_sender_field: Also store the From header under 'sender'
+                (kept for backwards compatibility). Pass False to skip the
+                duplicate key on large result sets.
 
     Returns:
-            By default, list of dicts with keys: id, threadId, subject, sender, from, to, date, snippet.
+            By default, list of dicts with keys: id, threadId, subject, from, to, date, snippet, labelIds
+            (plus sender unless legacy_sender_field=False).
             If raw=True, returns the first page list() response.
     """
     if max_results < 1:
@@ -242,7 +422,6 @@ def search_messages(
             break
 
         # Batch fetch metadata for this page of results to reduce round-trips.
-        batch = gmail.new_batch_http_request()
         batch_results: dict[str, dict] = {}
 
         def _callback(
@@ -251,32 +430,25 @@ def search_messages(
             if not exception:
                 batch_results[request_id] = response
 
-        for ref in message_refs:
-            msg_id = ref.get("id")
-            if not msg_id:
-                continue
-            batch.add(
-                gmail.users()
-                .messages()
-                .get(
-                    userId=user_id,
-                    id=msg_id,
-                    format="metadata",
-                    metadataHeaders=["From", "To", "Subject", "Date"],
-                ),
-                callback=_callback,
-                request_id=msg_id,
-            )
-
-        # Wrap batch in a simple object with .execute() for retry helper.
-        class _BatchWrapper:
-            def __init__(self, b: Any):
-                self.b = b
-
-            def execute(self) -> Any:
-                return self.b.execute()
-
-        execute_with_retry_http_error(_BatchWrapper(batch), is_write=False)
+        msg_ids = [ref["id"] for ref in message_refs if ref.get("id")]
+        # A list page holds up to 500 ids; split it into batches Gmail accepts.
+        for start in range(0, len(msg_ids), _BATCH_MAX_CALLS):
+            batch = gmail.new_batch_http_request()
+            for msg_id in msg_ids[start : start + _BATCH_MAX_CALLS]:
+                batch.add(
+                    gmail.users()
+                    .messages()
+                    .get(
+                        userId=user_id,
+                        id=msg_id,
+                        format="metadata",
+                        metadataHeaders=_METADATA_HEADERS,
+                    ),
+                    callback=_callback,
+                    request_id=msg_id,
+                )
+            # The retry helper only needs .execute(), which batches provide.
+            execute_with_retry_http_error(batch, is_write=False)
 
         # Process batch results in order.
         for ref in message_refs:
@@ -287,19 +459,19 @@ def search_messages(
 
             payload = meta.get("payload") or {}
             headers = _headers_to_dict(payload.get("headers"))
-            sender = headers.get("from")
-            collected.append(
-                {
-                    "id": meta.get("id"),
-                    "threadId": meta.get("threadId"),
-                    "subject": headers.get("subject"),
-                    "sender": sender,
-                    "from": headers.get("from"),
-                    "to": headers.get("to"),
-                    "date": headers.get("date"),
-                    "snippet": meta.get("snippet"),
-                }
-            )
+            result = {
+                "id": meta.get("id"),
+                "threadId": meta.get("threadId"),
+                "subject": headers.get("subject"),
+                "from": headers.get("from"),
+                "to": headers.get("to"),
+                "date": headers.get("date"),
+                "snippet": meta.get("snippet"),
+                "labelIds": meta.get("labelIds") or [],
+            }
+            if legacy_sender_field:
+                result["sender"] = result["from"]
+            collected.append(result)
 
             if progress_callback:
                 progress_callback(len(collected), max_results)
@@ -316,6 +488,33 @@ def search_messages(
     return cast(list[MessageMetadataDict], collected)
 
 
+def search_messages_table(
+    gmail: Any,
+    query: str,
+    *,
+    user_id: str = "me",
+    max_results: int = 50,
+    include_spam_trash: bool = False,
+    progress_callback: Any | None = None,
+) -> MessageMetadataTable:
+    """Search Gmail and return results as a column-oriented table.
+
+    Same arguments as search_messages (minus raw). Prefer this for large
+    searches or when the results are headed for a DataFrame
+    (see MessageMetadataTable.to_pandas).
+    """
+    messages = search_messages(
+        gmail,
+        query,
+        user_id=user_id,
+        max_results=max_results,
+        include_spam_trash=include_spam_trash,
+        progress_callback=progress_callback,
+        legacy_sender_field=False,
+    )
+    return MessageMetadataTable.from_messages(cast(list[dict], messages))
+
+
 @api_call("Gmail mark_read", is_write=True)
 def mark_read(
     gmail: Any,
@@ -374,6 +573,58 @@ def archive_message(
     return response if raw else None
 
 
+@api_call("Gmail bulk_modify", is_write=True)
+def bulk_modify(
+    gmail: Any,
+    message_ids: Sequence[str],
+    *,
+    add_label_ids: Sequence[str] | None = None,
+    remove_label_ids: Sequence[str] | None = None,
+    user_id: str = "me",
+) -> None:
+    """Add and/or remove labels on many messages with users.messages.batchModify.
+
+    Sends one request per 1000 message IDs instead of one per message.
+
+    Args:
+        gmail: Gmail API Resource
+        message_ids: IDs of the messages to modify
+        add_label_ids: Label IDs to add to every message
+        remove_label_ids: Label IDs to remove from every message
+        user_id: Gmail userId (default "me")
+    """
+    body: dict[str, Any] = {}
+    if add_label_ids:
+        body["addLabelIds"] = list(add_label_ids)
+    if remove_label_ids:
+        body["removeLabelIds"] = list(remove_label_ids)
+    if not body:
+        return
+
+    for start in range(0, len(message_ids), _BATCH_MODIFY_MAX_IDS):
+        chunk = list(message_ids[start : start + _BATCH_MODIFY_MAX_IDS])
+        request = (
+            gmail.users()
+            .messages()
+            .batchModify(userId=user_id, body={"ids": chunk, **body})
+        )
+        execute_with_retry_http_error(request, is_write=True)
+
+
+def bulk_mark_read(
+    gmail: Any, message_ids: Sequence[str], *, user_id: str = "me"
+) -> None:
+    """Mark many messages as read (batched counterpart of mark_read)."""
+    bulk_modify(gmail, message_ids, remove_label_ids=["UNREAD"], user_id=user_id)
+
+
+def bulk_archive(
+    gmail: Any, message_ids: Sequence[str], *, user_id: str = "me"
+) -> None:
+    """Archive many messages (batched counterpart of archive_message)."""
+    bulk_modify(gmail, message_ids, remove_label_ids=["INBOX"], user_id=user_id)
+
+
 @api_call("Gmail get_message", is_write=False)
 def get_message(
     gmail: Any,
@@ -381,6 +632,7 @@ def get_message(
     *,
     user_id: str = "me",
     raw: bool = False,
+    prefer_first: bool = False,
 ) -> MessageFullDict | MessageDict:
     """Get full message details including body.
 
@@ -389,6 +641,9 @@ def get_message(
         message_id: Message ID
         user_id: Gmail userId (default "me")
         raw: If True, return the raw API response
+        prefer_first: If True, the body is only the first non-empty text/plain
+            part in document order and the rest of the tree is not walked. By default
+            every text/plain part is concatenated.
 
     Returns:
         Dict with id, threadId, subject, from, to, date, snippet, and body.
@@ -402,17 +657,21 @@ def get_message(
     payload = response.get("payload") or {}
     headers = _headers_to_dict(payload.get("headers"))
 
-    # Extract body
-    body = ""
+    # Extract body, walking the MIME tree depth-first in document order.
+    texts: list[str] = []
     parts = [payload]
     while parts:
-        part = parts.pop(0)
-        if part.get("parts"):
-            parts.extend(part.get("parts") or [])
+        part = parts.pop()
+        sub_parts = part.get("parts")
+        if sub_parts:
+            parts.extend(reversed(sub_parts))
         if part.get("mimeType") == "text/plain":
             data = part.get("body", {}).get("data")
             if data:
-                body += base64.urlsafe_b64decode(data).decode("utf-8")
+                texts.append(urlsafe_b64decode(data).decode("utf-8"))
+                if prefer_first:
+                    break
+    body = "".join(texts)
 
     return cast(
         MessageFullDict,
@@ -456,7 +715,47 @@ def get_attachment(
     )
     response = execute_with_retry_http_error(request, is_write=False)
     data = response.get("data", "")
-    return base64.urlsafe_b64decode(data)
+    return urlsafe_b64decode(data)  # type: ignore[no-any-return]
+
+
+@api_call("Gmail download_attachment", is_write=False)
+def download_attachment(
+    gmail: Any,
+    message_id: str,
+    attachment_id: str,
+    dest_path: str | Path,
+    *,
+    user_id: str = "me",
+) -> Path:
+    """Download a single attachment by ID straight to a file.
+
+    Unlike get_attachment, the decoded bytes are written in small chunks,
+    so a large attachment is never held in memory twice.
+
+    Args:
+        gmail: Gmail API Resource
+        message_id: Message ID containing the attachment
+        attachment_id: Attachment ID from message parts
+        dest_path: File to write
+        user_id: Gmail userId (default "me")
+
+    Returns:
+        Path to the written file
+    """
+    request = (
+        gmail.users()
+        .messages()
+        .attachments()
+        .get(userId=user_id, messageId=message_id, id=attachment_id)
+    )
+    response = execute_with_retry_http_error(request, is_write=False)
+    data = response.get("data", "")
+
+    dest = Path(dest_path)
+    with dest.open("wb") as f:
+        for start in range(0, len(data), _ATTACHMENT_DECODE_CHUNK):
+            f.write(urlsafe_b64decode(data[start : start + _ATTACHMENT_DECODE_CHUNK]))
+    return dest
 
 
 def _extract_attachments(payload: dict) -> list[AttachmentMetadataDict]:
@@ -465,11 +764,12 @@ def _extract_attachments(payload: dict) -> list[AttachmentMetadataDict]:
     Returns list of dicts with keys: filename, attachment_id, mime_type, size
     """
     attachments: list[AttachmentMetadataDict] = []
-    parts = [payload]
+    parts = deque([payload])
     while parts:
-        part = parts.pop(0)
-        if part.get("parts"):
-            parts.extend(part.get("parts") or [])
+        part = parts.popleft()
+        sub_parts = part.get("parts")
+        if sub_parts:
+            parts.extend(sub_parts)
 
         body = part.get("body", {})
         attachment_id = body.get("attachmentId")
@@ -498,6 +798,7 @@ def save_attachments(
     max_messages: int = 50,
     filename_filter: str | None = None,
     progress_callback: Any | None = None,
+    max_workers: int = 8,
 ) -> list[Path]:
     """Save all attachments from messages matching a query to a folder.
 
@@ -509,6 +810,8 @@ def save_attachments(
         max_messages: Maximum number of messages to process
         filename_filter: Optional substring filter for filenames (case-insensitive)
         progress_callback: Optional callable(saved_count, message_index, total_messages)
+        max_workers: Number of concurrent message and attachment fetches;
+            1 disables the thread pool. Files are still written in message order.
 
     Returns:
         List of Paths to saved attachment files
@@ -518,44 +821,151 @@ def save_attachments(
 
     # Search for messages
     messages = search_messages(gmail, query, user_id=user_id, max_results=max_messages)
+    indexed_ids = [
+        (idx, msg_meta["id"])
+        for idx, msg_meta in enumerate(messages)
+        if msg_meta.get("id")
+    ]
+
+    def _service() -> Any:
+        return _thread_gmail(gmail) if max_workers > 1 else gmail
+
+    def _fetch_message(msg_id: str) -> dict:
+        # Get full message to access parts (reuse decorated get_message)
+        return cast(dict, get_message(_service(), msg_id, user_id=user_id, raw=True))
+
+    def _fetch_attachment(msg_id: str, attachment_id: str, target: Path) -> Path:
+        return download_attachment(  # type: ignore[no-any-return]
+            _service(), msg_id, attachment_id, target, user_id=user_id
+        )
 
     saved_files: list[Path] = []
+    # Targets handed to in-flight downloads, which may not exist on disk yet.
+    claimed: set[Path] = set()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        # Pick each target in message order as its message arrives, so
+        # duplicate-name handling stays deterministic, and stream the
+        # attachment straight into it.
+        downloads: list[tuple[int, Future[Path]]] = []
+        full_messages = pool.map(_fetch_message, [msg_id for _, msg_id in indexed_ids])
+        for (idx, msg_id), msg in zip(indexed_ids, full_messages):
+            for att in _extract_attachments(msg.get("payload", {})):
+                filename = att["filename"]
+
+                # Apply filename filter if specified
+                if filename_filter and filename_filter.lower() not in filename.lower():
+                    continue
+
+                # Handle duplicate filenames by adding message ID prefix if needed
+                target = dest / filename
+                if target in claimed or target.exists():
+                    stem = Path(filename).stem
+                    suffix = Path(filename).suffix
+                    target = dest / f"{stem}_{msg_id[:8]}{suffix}"
+                claimed.add(target)
+
+                future = pool.submit(
+                    _fetch_attachment, msg_id, att["attachment_id"], target
+                )
+                downloads.append((idx, future))
+
+        for idx, future in downloads:
+            saved_files.append(future.result())
 
-    for idx, msg_meta in enumerate(messages):
-        msg_id = msg_meta.get("id")
-        if not msg_id:
-            continue
+            if progress_callback:
+                progress_callback(len(saved_files), idx + 1, len(messages))
 
-        # Get full message to access parts (reuse decorated get_message)
-        msg = get_message(gmail, msg_id, user_id=user_id, raw=True)
+    return saved_files
 
-        payload = msg.get("payload", {})
-        attachments = _extract_attachments(payload)
 
-        for att in attachments:
-            filename = att["filename"]
+async def search_messages_async(
+    gmail: Any,
+    query: str,
+    *,
+    user_id: str = "me",
+    max_results: int = 50,
+    include_spam_trash: bool = False,
+    raw: bool = False,
+    progress_callback: Any | None = None,
+    legacy_sender_field: bool = True,
+) -> list[MessageMetadataDict] | dict:
+    """Async variant of search_messages.
 
-            # Apply filename filter if specified
-            if filename_filter and filename_filter.lower() not in filename.lower():
-                continue
+    The search runs in a worker thread with its own HTTP connection, so
+    several searches can be awaited together (e.g. with asyncio.gather).
+    Each page's metadata is still fetched with batch requests.
 
-            # Download attachment
-            data = get_attachment(gmail, msg_id, att["attachment_id"], user_id=user_id)
+    Args:
+        gmail: Gmail API Resource
+        query: Gmail search query string (same syntax as the web UI)
+        user_id: Gmail userId (default "me")
+        max_results: Max messages to return (pagination handled)
+        include_spam_trash: Include spam and trash
+        raw: If True, return the raw list() response for the first page
+        progress_callback: Optional callable(current_count, total_count),
+            called from the worker thread.
+        legacy_sender_field: Also store the From header under 'sender'.
 
-            # Handle duplicate filenames by adding message ID prefix if needed
-            target = dest / filename
-            if target.exists():
-                stem = Path(filename).stem
-                suffix = Path(filename).suffix
-                target = dest / f"{stem}_{msg_id[:8]}{suffix}"
+    Returns:
+        The same result as search_messages.
+    """
+    return await asyncio.to_thread(  # type: ignore[no-any-return]
+        _in_worker_thread,
+        search_messages,
+        gmail,
+        query,
+        user_id=user_id,
+        max_results=max_results,
+        include_spam_trash=include_spam_trash,
+        raw=raw,
+        progress_callback=progress_callback,
+        legacy_sender_field=legacy_sender_field,
+    )
 
-            target.write_bytes(data)
-            saved_files.append(target)
 
-            if progress_callback:
-                progress_callback(len(saved_files), idx + 1, len(messages))
+async def save_attachments_async(
+    gmail: Any,
+    query: str,
+    dest_folder: str | Path,
+    *,
+    user_id: str = "me",
+    max_messages: int = 50,
+    filename_filter: str | None = None,
+    progress_callback: Any | None = None,
+    max_workers: int = 8,
+) -> list[Path]:
+    """Async variant of save_attachments.
 
-    return saved_files
+    Runs save_attachments in a worker thread, so the event loop stays free
+    while messages and attachments are fetched by its thread pool.
+
+    Args:
+        gmail: Gmail API Resource
+        query: Gmail search query string
+        dest_folder: Destination folder path
+        user_id: Gmail userId (default "me")
+        max_messages: Maximum number of messages to process
+        filename_filter: Optional substring filter for filenames (case-insensitive)
+        progress_callback: Optional callable(saved_count, message_index,
+            total_messages), called from the worker thread.
+        max_workers: Number of concurrent message and attachment fetches.
+
+    Returns:
+        List of Paths to saved attachment files
+    """
+    return await asyncio.to_thread(  # type: ignore[no-any-return]
+        _in_worker_thread,
+        save_attachments,
+        gmail,
+        query,
+        dest_folder,
+        user_id=user_id,
+        max_messages=max_messages,
+        filename_filter=filename_filter,
+        progress_callback=progress_callback,
+        max_workers=max_workers,
+    )
 
 
 class GmailClient(BaseClient):
@@ -588,6 +998,29 @@ class GmailClient(BaseClient):
             idempotency_key=idempotency_key,
         )
 
+    def send_email_bulk(
+        self,
+        *,
+        to_list: Sequence[str | Sequence[str]],
+        subject: str,
+        body: str,
+        attachments: Sequence[str | Path] | None = None,
+        cc: str | Sequence[str] | None = None,
+        bcc: str | Sequence[str] | None = None,
+        user_id: str = "me",
+    ) -> list[str]:
+        """Send the same email separately to each recipient."""
+        return send_email_bulk(  # type: ignore[no-any-return]
+            self.service,
+            to_list=to_list,
+            subject=subject,
+            body=body,
+            attachments=attachments,
+            cc=cc,
+            bcc=bcc,
+            user_id=user_id,
+        )
+
     def search_messages(
         self,
         query: str,
@@ -597,6 +1030,7 @@ class GmailClient(BaseClient):
         include_spam_trash: bool = False,
         raw: bool = False,
         progress_callback: Any | None = None,
+        legacy_sender_field: bool = True,
     ) -> list[MessageMetadataDict] | dict:
         """Search Gmail and return lightweight message dicts."""
         return search_messages(  # type: ignore[no-any-return]
@@ -607,6 +1041,49 @@ class GmailClient(BaseClient):
             include_spam_trash=include_spam_trash,
             raw=raw,
             progress_callback=progress_callback,
+            legacy_sender_field=legacy_sender_field,
+        )
+
+    async def search_messages_async(
+        self,
+        query: str,
+        *,
+        user_id: str = "me",
+        max_results: int = 50,
+        include_spam_trash: bool = False,
+        raw: bool = False,
+        progress_callback: Any | None = None,
+        legacy_sender_field: bool = True,
+    ) -> list[MessageMetadataDict] | dict:
+        """Async variant of search_messages."""
+        return await search_messages_async(
+            self.service,
+            query,
+            user_id=user_id,
+            max_results=max_results,
+            include_spam_trash=include_spam_trash,
+            raw=raw,
+            progress_callback=progress_callback,
+            legacy_sender_field=legacy_sender_field,
+        )
+
+    def search_messages_table(
+        self,
+        query: str,
+        *,
+        user_id: str = "me",
+        max_results: int = 50,
+        include_spam_trash: bool = False,
+        progress_callback: Any | None = None,
+    ) -> MessageMetadataTable:
+        """Search Gmail and return results as a column-oriented table."""
+        return search_messages_table(
+            self.service,
+            query,
+            user_id=user_id,
+            max_results=max_results,
+            include_spam_trash=include_spam_trash,
+            progress_callback=progress_callback,
         )
 
     def mark_read(
@@ -654,12 +1131,40 @@ class GmailClient(BaseClient):
             raw=raw,
         )
 
+    def bulk_modify(
+        self,
+        message_ids: Sequence[str],
+        *,
+        add_label_ids: Sequence[str] | None = None,
+        remove_label_ids: Sequence[str] | None = None,
+        user_id: str = "me",
+    ) -> None:
+        """Add and/or remove labels on many messages in batched requests."""
+        bulk_modify(
+            self.service,
+            message_ids,
+            add_label_ids=add_label_ids,
+            remove_label_ids=remove_label_ids,
+            user_id=user_id,
+        )
+
+    def bulk_mark_read(
+        self, message_ids: Sequence[str], *, user_id: str = "me"
+    ) -> None:
+        """Mark many messages as read."""
+        bulk_mark_read(self.service, message_ids, user_id=user_id)
+
+    def bulk_archive(self, message_ids: Sequence[str], *, user_id: str = "me") -> None:
+        """Archive many messages."""
+        bulk_archive(self.service, message_ids, user_id=user_id)
+
     def get_message(
         self,
         message_id: str,
         *,
         user_id: str = "me",
         raw: bool = False,
+        prefer_first: bool = False,
     ) -> MessageFullDict | MessageDict:
         """Get full message details including body."""
         return get_message(  # type: ignore[no-any-return]
@@ -667,6 +1172,7 @@ class GmailClient(BaseClient):
             message_id,
             user_id=user_id,
             raw=raw,
+            prefer_first=prefer_first,
         )
 
     def get_attachment(
@@ -684,6 +1190,23 @@ class GmailClient(BaseClient):
             user_id=user_id,
         )
 
+    def download_attachment(
+        self,
+        message_id: str,
+        attachment_id: str,
+        dest_path: str | Path,
+        *,
+        user_id: str = "me",
+    ) -> Path:
+        """Download a single attachment by ID straight to a file."""
+        return download_attachment(  # type: ignore[no-any-return]
+            self.service,
+            message_id,
+            attachment_id,
+            dest_path,
+            user_id=user_id,
+        )
+
     def save_attachments(
         self,
         query: str,
@@ -693,6 +1216,7 @@ class GmailClient(BaseClient):
         max_messages: int = 50,
         filename_filter: str | None = None,
         progress_callback: Any | None = None,
+        max_workers: int = 8,
     ) -> list[Path]:
         """Save all attachments from messages matching a query to a folder."""
         return save_attachments(
@@ -703,6 +1227,30 @@ class GmailClient(BaseClient):
             max_messages=max_messages,
             filename_filter=filename_filter,
             progress_callback=progress_callback,
+            max_workers=max_workers,
+        )
+
+    async def save_attachments_async(
+        self,
+        query: str,
+        dest_folder: str | Path,
+        *,
+        user_id: str = "me",
+        max_messages: int = 50,
+        filename_filter: str | None = None,
+        progress_callback: Any | None = None,
+        max_workers: int = 8,
+    ) -> list[Path]:
+        """Async variant of save_attachments."""
+        return await save_attachments_async(
+            self.service,
+            query,
+            dest_folder,
+            user_id=user_id,
+            max_messages=max_messages,
+            filename_filter=filename_filter,
+            progress_callback=progress_callback,
+            max_workers=max_workers,
         )
 
     def list_labels(
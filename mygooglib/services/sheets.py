@@ -594,6 +594,11 @@ def to_dataframe(
         raise ImportError("Pandas is required for this feature. Install 'pandas'.")
 
     values = get_range(sheets, spreadsheet_id, a1_range, drive=drive)
+    return _values_to_dataframe(values, header=header)
+
+
+def _values_to_dataframe(values: list[list[Any]], *, header: bool) -> "pd.DataFrame":
+    """Build a DataFrame from a list-of-lists range (internal helper)."""
     if not values:
         return pd.DataFrame()
 
@@ -602,6 +607,44 @@ def to_dataframe(
     return pd.DataFrame(values)
 
 
+def to_dataframes(
+    sheets: Any,
+    spreadsheet_id: str,
+    ranges: list[str],
+    *,
+    drive: Any | None = None,
+    header: bool = True,
+) -> dict[str, "pd.DataFrame"]:
+    """Read several ranges into Pandas DataFrames with a single batchGet call.
+
+    Requires 'pandas' to be installed.
+
+    Args:
+        sheets: Sheets API Resource
+        spreadsheet_id: Spreadsheet ID, title, or URL
+        ranges: A1 range strings
+        drive: Optional Drive API Resource for title resolution
+        header: If True, use the first row of each range as its header
+
+    Returns:
+        Dict mapping each requested range string to its DataFrame.
+
+    Raises:
+        ImportError: If pandas is not installed.
+    """
+    if pd is None:
+        raise ImportError("Pandas is required for this feature. Install 'pandas'.")
+
+    response = batch_get(sheets, spreadsheet_id, ranges, drive=drive, raw=True)
+    # valueRanges come back in request order, but with normalized range names,
+    # so key the result by the ranges the caller asked for.
+    value_ranges = response.get("valueRanges", [])
+    return {
+        a1_range: _values_to_dataframe(vr.get("values", []), header=header)
+        for a1_range, vr in zip(ranges, value_ranges)
+    }
+
+
 def from_dataframe(
     sheets: Any,
     spreadsheet_id: str,
@@ -1096,6 +1139,22 @@ class SheetsClient(BaseClient):
             header=header,
         )
 
+    def to_dataframes(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        *,
+        header: bool = True,
+    ) -> dict[str, "pd.DataFrame"]:
+        """Read several ranges into Pandas DataFrames with a single batchGet call."""
+        return to_dataframes(
+            self.service,
+            spreadsheet_id,
+            ranges,
+            drive=self.drive,
+            header=header,
+        )
+
     def from_dataframe(
         self,
         spreadsheet_id: str,
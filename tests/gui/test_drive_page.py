@@ -0,0 +1,24 @@
+"""Tests for DrivePage search narrowing."""
+
+import time
+from types import SimpleNamespace
+
+from mygoog_gui.pages.drive import DrivePage
+
+
+def _page_after_search(query, files):
+    return SimpleNamespace(_last_search=(query, files, time.monotonic()))
+
+
+def test_extended_query_is_narrowed_locally():
+    files = [{"name": "report.pdf"}, {"name": "repo notes"}]
+    page = _page_after_search("rep", files)
+
+    assert DrivePage._narrow_last_search(page, "Report") == [{"name": "report.pdf"}]
+
+
+def test_query_containing_previous_one_goes_to_server():
+    # "port" results never included "my report.pdf", so they can't be reused.
+    page = _page_after_search("port", [{"name": "port list.txt"}])
+
+    assert DrivePage._narrow_last_search(page, "report") is None
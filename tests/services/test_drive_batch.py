@@ -0,0 +1,76 @@
+"""Tests for batched Drive metadata operations."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mygooglib.services import drive as drive_mod
+
+
+def test_delete_files_trashes_through_one_batch() -> None:
+    mock_drive = MagicMock()
+    failure = RuntimeError("not found")
+
+    with patch.object(
+        drive_mod,
+        "execute_batch_with_retry",
+        return_value=({"a": {"id": "a"}, "c": {"id": "c"}}, {"b": failure}),
+    ) as batch:
+        result = drive_mod.delete_files(mock_drive, ["a", "b", "c"])
+
+    requests = batch.call_args.args[1]
+    assert list(requests) == ["a", "b", "c"]
+    assert batch.call_args.kwargs["is_write"] is True
+    mock_drive.files().update.assert_any_call(
+        fileId="b", body={"trashed": True}, fields="id"
+    )
+    assert result == {
+        "deleted": ["a", "c"],
+        "errors": ["b: not found"],
+        "dry_run": False,
+    }
+
+
+def test_delete_files_dry_run_sends_nothing() -> None:
+    mock_drive = MagicMock()
+
+    with patch.object(drive_mod, "execute_batch_with_retry") as batch:
+        result = drive_mod.delete_files(mock_drive, ["a", "b"], dry_run=True)
+
+    batch.assert_not_called()
+    assert [r["resource_id"] for r in result["reports"]] == ["a", "b"]
+
+
+def test_create_folders_returns_ids_in_order() -> None:
+    mock_drive = MagicMock()
+
+    with patch.object(
+        drive_mod,
+        "execute_batch_with_retry",
+        return_value=({"1": {"id": "id-b"}, "0": {"id": "id-a"}}, {}),
+    ):
+        ids = drive_mod.create_folders(mock_drive, [("a", None), ("b", "parent")])
+
+    assert ids == ["id-a", "id-b"]
+    mock_drive.files().create.assert_any_call(
+        body={
+            "name": "b",
+            "mimeType": drive_mod.FOLDER_MIME_TYPE,
+            "parents": ["parent"],
+        },
+        fields="id",
+    )
+
+
+def test_create_folders_raises_first_failure() -> None:
+    with (
+        patch.object(
+            drive_mod,
+            "execute_batch_with_retry",
+            return_value=({}, {"0": ValueError("quota")}),
+        ),
+        pytest.raises(ValueError, match="quota"),
+    ):
+        drive_mod.create_folders(MagicMock(), [("a", None)])
@@ -0,0 +1,288 @@
+"""Tests for Drive ranged downloads and async helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import pairwise
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mygooglib.services import drive as drive_mod
+from mygooglib.services.drive import (
+    _split_ranges,
+    download_file,
+    download_file_async,
+)
+
+
+def _ranged_drive(
+    content: bytes,
+    mime_type: str = "application/octet-stream",
+    *,
+    honor_range: bool = True,
+):
+    """Drive mock whose get_media honors the Range header set on the request.
+
+    With honor_range=False it answers every request with a 200 and the whole
+    body, like a server or proxy that ignores Range.
+    """
+    mock_drive = MagicMock()
+    mock_drive.files().get().execute.return_value = {
+        "mimeType": mime_type,
+        "name": "big.bin",
+        "size": str(len(content)),
+    }
+
+    def _get_media(fileId):
+        request = MagicMock()
+        request.headers = {}
+        request.postproc = lambda resp, body: body
+
+        def _execute():
+            if not honor_range or "Range" not in request.headers:
+                return request.postproc(MagicMock(status=200), content)
+            start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+            body = content[int(start) : int(end) + 1]
+            return request.postproc(MagicMock(status=206), body)
+
+        request.execute.side_effect = _execute
+        return request
+
+    mock_drive.files().get_media.side_effect = _get_media
+    return mock_drive
+
+
+def test_split_ranges_covers_whole_file():
+    size = 5 * 1024 * 1024 + 3
+    ranges = _split_ranges(size, 4)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == size - 1
+    for (_, prev_end), (start, _) in pairwise(ranges):
+        assert start == prev_end + 1
+
+
+def test_download_file_async_reassembles_ranges(tmp_path):
+    content = bytes(range(256)) * (12 * 1024)  # 3 MiB
+    mock_drive = _ranged_drive(content)
+    dest = tmp_path / "out.bin"
+
+    with (
+        patch.object(drive_mod, "_thread_http", return_value=MagicMock()),
+        patch.object(
+            drive_mod, "_thread_drive", side_effect=lambda d: d
+        ) as thread_drive,
+    ):
+        result = asyncio.run(download_file_async(mock_drive, "f1", dest, parts=3))
+
+    assert result == dest
+    assert dest.read_bytes() == content
+    assert mock_drive.files().get_media.call_count == 3
+    # The metadata probe ran on a thread clone, and no scratch file remains.
+    thread_drive.assert_called_once_with(mock_drive)
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_download_file_parts_reassembles_ranges(tmp_path):
+    content = bytes(range(256)) * (12 * 1024)  # 3 MiB
+    mock_drive = _ranged_drive(content)
+    dest = tmp_path / "out.bin"
+    progress = []
+
+    with patch.object(drive_mod, "_thread_http", return_value=MagicMock()):
+        result = download_file(
+            mock_drive,
+            "f1",
+            dest,
+            parts=3,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+    assert result == dest
+    assert dest.read_bytes() == content
+    assert mock_drive.files().get_media.call_count == 3
+    assert progress[-1] == (len(content), len(content))
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_download_file_parts_falls_back_when_range_ignored(tmp_path):
+    content = bytes(range(256)) * (12 * 1024)  # 3 MiB
+    mock_drive = _ranged_drive(content, honor_range=False)
+    dest = tmp_path / "out.bin"
+
+    with (
+        patch.object(drive_mod, "_thread_http", return_value=MagicMock()),
+        patch.object(drive_mod, "_download_request") as single_stream,
+    ):
+        download_file(mock_drive, "f1", dest, parts=3)
+
+    single_stream.assert_called_once()
+    assert single_stream.call_args.args[0] == dest
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_file_async_falls_back_when_range_ignored(tmp_path):
+    content = bytes(range(256)) * (12 * 1024)  # 3 MiB
+    mock_drive = _ranged_drive(content, honor_range=False)
+    dest = tmp_path / "out.bin"
+
+    with (
+        patch.object(drive_mod, "_thread_http", return_value=MagicMock()),
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(drive_mod, "download_file", return_value=dest) as fallback,
+    ):
+        result = asyncio.run(download_file_async(mock_drive, "f1", dest, parts=3))
+
+    assert result == dest
+    fallback.assert_called_once()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_file_async_falls_back_for_workspace_files(tmp_path):
+    mock_drive = _ranged_drive(b"", mime_type="application/vnd.google-apps.document")
+    dest = tmp_path / "doc.pdf"
+
+    with (
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d) as clone,
+        patch.object(drive_mod, "download_file", return_value=dest) as fallback,
+    ):
+        result = asyncio.run(
+            download_file_async(
+                mock_drive, "doc1", dest, export_mime_type="application/pdf"
+            )
+        )
+
+    assert result == dest
+    fallback.assert_called_once()
+    assert clone.call_count == 2  # metadata probe and fallback download
+
+
+def _media_drive(chunks):
+    """Drive mock for download_file with MediaIoBaseDownload patched out."""
+    mock_drive = MagicMock()
+    mock_drive.files().get().execute.return_value = {
+        "mimeType": "text/plain",
+        "name": "a.txt",
+        "size": "5",
+    }
+
+    class _Downloader:
+        def __init__(self, fd, request):
+            self._fd = fd
+            self._chunks = list(chunks)
+
+        def next_chunk(self):
+            chunk = self._chunks.pop(0)
+            if isinstance(chunk, Exception):
+                raise chunk
+            self._fd.write(chunk)
+            return None, not self._chunks
+
+    return mock_drive, _Downloader
+
+
+def test_download_file_writes_atomically(tmp_path):
+    mock_drive, downloader = _media_drive([b"hel", b"lo"])
+    dest = tmp_path / "a.txt"
+
+    with patch.object(drive_mod, "MediaIoBaseDownload", downloader):
+        drive_mod.download_file(mock_drive, "file_id", dest)
+
+    assert dest.read_bytes() == b"hello"
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_download_file_failure_keeps_existing_dest(tmp_path):
+    mock_drive, downloader = _media_drive([b"hel", RuntimeError("reset")])
+    dest = tmp_path / "a.txt"
+    dest.write_bytes(b"previous")
+
+    with (
+        patch.object(drive_mod, "MediaIoBaseDownload", downloader),
+        pytest.raises(RuntimeError),
+    ):
+        drive_mod.download_file(mock_drive, "file_id", dest)
+
+    assert dest.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_download_file_trims_preallocation_to_body(tmp_path):
+    # Metadata claims 5 bytes; the body is shorter, so no reserved tail remains.
+    mock_drive, downloader = _media_drive([b"hi"])
+    dest = tmp_path / "a.txt"
+
+    with patch.object(drive_mod, "MediaIoBaseDownload", downloader):
+        drive_mod.download_file(mock_drive, "file_id", dest)
+
+    assert dest.read_bytes() == b"hi"
+
+
+def test_download_file_mime_hint_skips_metadata(tmp_path):
+    mock_drive, downloader = _media_drive([b"hello"])
+    dest = tmp_path / "a.txt"
+
+    with patch.object(drive_mod, "MediaIoBaseDownload", downloader):
+        drive_mod.download_file(
+            mock_drive, "file_id", dest, mime_type_hint="text/plain"
+        )
+
+    assert dest.read_bytes() == b"hello"
+    assert not any(c.kwargs for c in mock_drive.files().get.call_args_list)
+
+
+def test_download_file_assume_binary_falls_back_for_workspace(tmp_path):
+    from googleapiclient.errors import HttpError
+
+    mock_drive = MagicMock()
+    mock_drive.files().get().execute.return_value = {
+        "mimeType": drive_mod.GOOGLE_DOC_MIME,
+        "name": "Doc",
+    }
+    not_downloadable = HttpError(
+        MagicMock(status=403),
+        b'{"error": {"errors": [{"reason": "fileNotDownloadable"}], "message": "x"}}',
+    )
+    attempts = []
+
+    class _Downloader:
+        def __init__(self, fd, request):
+            self._fd = fd
+            attempts.append(request)
+
+        def next_chunk(self):
+            if len(attempts) == 1:
+                raise not_downloadable
+            self._fd.write(b"%PDF")
+            return None, True
+
+    dest = tmp_path / "doc.pdf"
+    with patch.object(drive_mod, "MediaIoBaseDownload", _Downloader):
+        drive_mod.download_file(
+            mock_drive,
+            "file_id",
+            dest,
+            export_mime_type="application/pdf",
+            assume_binary=True,
+        )
+
+    assert dest.read_bytes() == b"%PDF"
+    assert attempts[1] is mock_drive.files().export_media.return_value
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_list_files_async_runs_on_thread_clone():
+    clone = MagicMock()
+    clone.files().list().execute.return_value = {"files": [{"id": "1"}]}
+
+    async def _gather():
+        return await asyncio.gather(
+            drive_mod.list_files_async(MagicMock(), parent_id="a"),
+            drive_mod.list_files_async(MagicMock(), parent_id="b"),
+        )
+
+    with patch.object(drive_mod, "_thread_drive", return_value=clone) as thread_drive:
+        results = asyncio.run(_gather())
+
+    assert results == [[{"id": "1"}], [{"id": "1"}]]
+    assert thread_drive.call_count == 2
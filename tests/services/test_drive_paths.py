@@ -0,0 +1,173 @@
+"""Tests for path resolution and the folder lookup cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from mygooglib.core.exceptions import NotFoundError
+from mygooglib.services.drive import (
+    DEFAULT_FIELDS,
+    FOLDER_MIME_TYPE,
+    MIN_FIELDS,
+    clear_path_cache,
+    delete_file,
+    resolve_path,
+)
+
+
+def _folder(file_id: str, name: str) -> dict:
+    return {"id": file_id, "name": name, "mimeType": FOLDER_MIME_TYPE}
+
+
+def test_resolve_path_reuses_cached_ancestors() -> None:
+    clear_path_cache()
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {"files": [_folder("a_id", "A")]},
+        {
+            "files": [
+                {**_folder("b_id", "B"), "parents": ["a_id"]},
+                {
+                    "id": "x_id",
+                    "name": "x.txt",
+                    "mimeType": "text/plain",
+                    "parents": ["b_id"],
+                },
+            ]
+        },
+        {"files": [{"id": "y_id", "name": "y.txt", "mimeType": "text/plain"}]},
+    ]
+
+    assert resolve_path(mock_drive, "A/B/x.txt")["id"] == "x_id"
+    assert resolve_path(mock_drive, "A/B/y.txt")["id"] == "y_id"
+
+    # A and B were listed once; the second path only needed its leaf.
+    assert mock_drive.files().list().execute.call_count == 3
+    clear_path_cache()
+
+
+def test_resolve_path_walks_chain_with_one_query() -> None:
+    clear_path_cache()
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {
+        "files": [
+            {**_folder("b_id", "B"), "parents": ["base_id"]},
+            {**_folder("c_id", "C"), "parents": ["b_id"]},
+            {**_folder("c_other", "C"), "parents": ["elsewhere"]},
+            {
+                "id": "x_id",
+                "name": "x.txt",
+                "mimeType": "text/plain",
+                "parents": ["c_id"],
+            },
+        ]
+    }
+
+    meta = resolve_path(mock_drive, "B/C/x.txt", parent_id="base_id")
+
+    assert meta["id"] == "x_id"
+    assert mock_drive.files().list().execute.call_count == 1
+    (q,) = [c.kwargs["q"] for c in mock_drive.files().list.call_args_list if c.kwargs]
+    assert q == "(name = 'B' or name = 'C' or name = 'x.txt') and trashed = false"
+    clear_path_cache()
+
+
+def test_resolve_path_falls_back_when_chain_is_ambiguous() -> None:
+    clear_path_cache()
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {
+            "files": [
+                {**_folder("b1", "B"), "parents": ["base_id"]},
+                {**_folder("b2", "B"), "parents": ["base_id"]},
+            ]
+        },
+        {"files": [_folder("b1", "B")]},
+        {"files": [{"id": "x_id", "name": "x.txt", "mimeType": "text/plain"}]},
+    ]
+
+    meta = resolve_path(mock_drive, "B/x.txt", parent_id="base_id")
+
+    assert meta["id"] == "x_id"
+    assert mock_drive.files().list().execute.call_count == 3
+    clear_path_cache()
+
+
+def test_delete_file_evicts_cached_folder() -> None:
+    clear_path_cache()
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {"files": [_folder("a_id", "A")]},
+        {"files": []},
+    ]
+
+    assert resolve_path(mock_drive, "A", fields=MIN_FIELDS)["id"] == "a_id"
+    delete_file(mock_drive, "a_id")
+    assert resolve_path(mock_drive, "A", fields=MIN_FIELDS) is None
+    clear_path_cache()
+
+
+def test_path_cache_is_per_account() -> None:
+    clear_path_cache()
+    first, second = MagicMock(), MagicMock()
+    first.files().list().execute.return_value = {"files": [_folder("a1", "A")]}
+    second.files().list().execute.return_value = {"files": [_folder("a2", "A")]}
+
+    assert resolve_path(first, "A", fields=MIN_FIELDS)["id"] == "a1"
+    assert resolve_path(second, "A", fields=MIN_FIELDS)["id"] == "a2"
+    clear_path_cache()
+
+
+def test_not_found_evicts_cached_parent() -> None:
+    clear_path_cache()
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {"files": [_folder("a_id", "A")]},
+        HttpError(MagicMock(status=404), b"File not found: a_id"),
+        {"files": [_folder("a_new", "A")]},
+    ]
+
+    resolve_path(mock_drive, "A", fields=MIN_FIELDS)
+    with pytest.raises(NotFoundError):
+        resolve_path(mock_drive, "A/x.txt")
+    assert resolve_path(mock_drive, "A", fields=MIN_FIELDS)["id"] == "a_new"
+    clear_path_cache()
+
+
+def test_resolve_path_requests_full_fields_only_for_leaf() -> None:
+    clear_path_cache()
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {"files": [_folder("a_id", "A")]},
+        {"files": [{"id": "x_id", "name": "x.txt", "mimeType": "text/plain"}]},
+    ]
+
+    resolve_path(mock_drive, "A/x.txt")
+
+    fields = [
+        c.kwargs["fields"]
+        for c in mock_drive.files().list.call_args_list
+        if "fields" in c.kwargs
+    ]
+    assert fields == [
+        f"nextPageToken, files({MIN_FIELDS})",
+        f"nextPageToken, files({DEFAULT_FIELDS})",
+    ]
+    clear_path_cache()
+
+
+def test_find_by_name_escapes_quotes_and_backslashes() -> None:
+    from mygooglib.services.drive import find_by_name
+
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {"files": []}
+
+    find_by_name(mock_drive, "it's a\\b")
+
+    (kwargs,) = [c.kwargs for c in mock_drive.files().list.call_args_list if c.kwargs]
+    assert kwargs["q"].startswith("(name = 'it\\'s a\\\\b')")
+    # Only the first match is used, so only one record is requested.
+    assert kwargs["pageSize"] == 1
@@ -0,0 +1,567 @@
+"""Tests for sync_folder transfer scheduling."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import ANY, MagicMock, patch
+
+import pytest
+
+from mygooglib.services import drive as drive_mod
+from mygooglib.services.drive import sync_folder
+
+
+def _empty_remote_drive() -> MagicMock:
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {"files": []}
+    return mock_drive
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_sync_folder_uploads_new_files(tmp_path: Path, max_workers: int) -> None:
+    for i in range(5):
+        (tmp_path / f"file{i}.txt").write_text(str(i))
+
+    calls = []
+    with (
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(
+            drive_mod,
+            "_apply_transfer",
+            side_effect=lambda d, kind, entry, target: calls.append((kind, entry.name)),
+        ),
+    ):
+        result = sync_folder(
+            _empty_remote_drive(), tmp_path, "folder_id", max_workers=max_workers
+        )
+
+    assert result["created"] == 5
+    assert result["errors"] == []
+    assert sorted(name for _, name in calls) == [f"file{i}.txt" for i in range(5)]
+    assert {kind for kind, _ in calls} == {"create"}
+
+
+def test_sync_folder_collects_worker_errors(tmp_path: Path) -> None:
+    (tmp_path / "ok.txt").write_text("ok")
+    (tmp_path / "bad.txt").write_text("bad")
+
+    def _transfer(d, kind, entry, target):
+        if entry.name == "bad.txt":
+            raise RuntimeError("boom")
+
+    with (
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(drive_mod, "_apply_transfer", side_effect=_transfer),
+    ):
+        result = sync_folder(_empty_remote_drive(), tmp_path, "folder_id")
+
+    assert result["created"] == 1
+    assert result["errors"] == ["bad.txt: boom"]
+
+
+def test_sync_folder_non_recursive_skips_remote_folders(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "it's.txt").write_text("b")
+    mock_drive = _empty_remote_drive()
+
+    sync_folder(mock_drive, tmp_path, "folder_id", recursive=False, dry_run=True)
+
+    kwargs = mock_drive.files().list.call_args.kwargs
+    assert f"mimeType != '{drive_mod.FOLDER_MIME_TYPE}'" in kwargs["q"]
+    # Few local files: only those names are requested.
+    assert "name = 'a.txt'" in kwargs["q"]
+    assert "name = 'it\\'s.txt'" in kwargs["q"]
+    assert kwargs["pageSize"] == 1000
+    assert kwargs["fields"] == f"nextPageToken, files({drive_mod.SYNC_FIELDS})"
+
+
+def test_sync_folder_lists_whole_folder_for_many_local_files(tmp_path: Path) -> None:
+    for i in range(drive_mod._SYNC_NAME_QUERY_MAX_FILES + 1):
+        (tmp_path / f"f{i}.txt").write_text(str(i))
+    mock_drive = _empty_remote_drive()
+
+    sync_folder(mock_drive, tmp_path, "folder_id", recursive=False, dry_run=True)
+
+    assert "name =" not in mock_drive.files().list.call_args.kwargs["q"]
+
+
+def test_list_files_reuses_cached_listing() -> None:
+    from mygooglib.core.utils.retry import clear_response_cache
+
+    clear_response_cache()
+    mock_drive = MagicMock()
+    request = mock_drive.files().list.return_value
+    request.uri = "https://drive/files?q=x"
+    request.method = "GET"
+    request.body = None
+    request.execute.return_value = {"files": [{"id": "1"}]}
+
+    first = drive_mod.list_files(mock_drive, cache_ttl_s=60)
+    second = drive_mod.list_files(mock_drive, cache_ttl_s=60)
+    clear_response_cache()
+
+    assert first == second == [{"id": "1"}]
+    assert request.execute.call_count == 1
+
+
+def test_sync_folder_compares_modified_times(tmp_path: Path) -> None:
+    import os
+
+    (tmp_path / "old.txt").write_text("old")
+    (tmp_path / "new.txt").write_text("new")
+    (tmp_path / "odd.txt").write_text("odd")
+    os.utime(tmp_path / "old.txt", (1_700_000_000, 1_700_000_000))
+    os.utime(tmp_path / "new.txt", (1_800_000_000, 1_800_000_000))
+
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {
+        "files": [
+            {
+                "id": file_id,
+                "name": name,
+                "modifiedTime": mtime,
+                "parents": ["folder_id"],
+            }
+            for file_id, name, mtime in [
+                ("o", "old.txt", "2024-01-01T00:00:00.000Z"),
+                ("n", "new.txt", "2024-01-01T00:00:00.000Z"),
+                ("x", "odd.txt", "not a date"),
+            ]
+        ]
+    }
+
+    result = sync_folder(mock_drive, tmp_path, "folder_id", dry_run=True)
+
+    assert result["skipped"] == 1
+    assert result["updated"] == 2
+    assert sorted(r["resource_id"] for r in result["reports"]) == ["n", "x"]
+
+
+def test_snapshot_subtree_lists_one_query_per_level() -> None:
+    listings = {
+        "'root_id' in parents": [
+            {
+                "id": "a",
+                "name": "a",
+                "mimeType": drive_mod.FOLDER_MIME_TYPE,
+                "parents": ["root_id"],
+            },
+            {
+                "id": "b",
+                "name": "b",
+                "mimeType": drive_mod.FOLDER_MIME_TYPE,
+                "parents": ["root_id"],
+            },
+            {
+                "id": "f1",
+                "name": "f1.txt",
+                "mimeType": "text/plain",
+                "parents": ["root_id"],
+            },
+        ],
+        "'a' in parents or 'b' in parents": [
+            {"id": "f2", "name": "f2.txt", "mimeType": "text/plain", "parents": ["a"]},
+            {"id": "f3", "name": "f3.txt", "mimeType": "text/plain", "parents": ["b"]},
+        ],
+    }
+    queries = []
+
+    def _list_files(drive, *, query, fields):
+        queries.append(query)
+        return listings[query]
+
+    with patch.object(drive_mod, "list_files", side_effect=_list_files):
+        tree = drive_mod._snapshot_subtree(MagicMock(), "root_id")
+
+    assert queries == list(listings)
+    assert [f["id"] for f in tree["root_id"]] == ["a", "b", "f1"]
+    assert [f["id"] for f in tree["a"]] == ["f2"]
+    assert [f["id"] for f in tree["b"]] == ["f3"]
+
+
+def test_sync_folder_to_root_alias_matches_existing_items(tmp_path: Path) -> None:
+    # Drive reports the real root ID in `parents`, never the "root" alias.
+    (tmp_path / "same.txt").write_text("same")
+    os.utime(tmp_path / "same.txt", (1_000_000_000, 1_000_000_000))
+    (tmp_path / "sub").mkdir()
+    listings = {
+        "'root' in parents": [
+            {
+                "id": "f",
+                "name": "same.txt",
+                "mimeType": "text/plain",
+                "modifiedTime": "2024-01-01T00:00:00.000Z",
+                "parents": ["0AREALROOT"],
+            },
+            {
+                "id": "sub_id",
+                "name": "sub",
+                "mimeType": drive_mod.FOLDER_MIME_TYPE,
+                "parents": ["0AREALROOT"],
+            },
+        ],
+        "'sub_id' in parents": [],
+    }
+
+    def _list_files(drive, *, query, fields):
+        return listings[query]
+
+    with patch.object(drive_mod, "list_files", side_effect=_list_files):
+        result = sync_folder(MagicMock(), tmp_path, "root", dry_run=True)
+
+    assert result["created"] == 0
+    assert result["skipped"] == 1
+    assert result["reports"] == []
+
+
+def test_snapshot_subtree_skips_folders_missing_locally(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    listings = {
+        "'root_id' in parents": [
+            {
+                "id": "a",
+                "name": "a",
+                "mimeType": drive_mod.FOLDER_MIME_TYPE,
+                "parents": ["root_id"],
+            },
+            {
+                "id": "b",
+                "name": "b",
+                "mimeType": drive_mod.FOLDER_MIME_TYPE,
+                "parents": ["root_id"],
+            },
+        ],
+        "'a' in parents": [],
+    }
+    queries = []
+
+    def _list_files(drive, *, query, fields):
+        queries.append(query)
+        return listings[query]
+
+    with patch.object(drive_mod, "list_files", side_effect=_list_files):
+        tree = drive_mod._snapshot_subtree(MagicMock(), "root_id", tmp_path)
+
+    assert queries == list(listings)
+    assert "b" not in tree
+
+
+def test_sync_folder_caps_concurrent_writes(tmp_path: Path) -> None:
+    import threading
+    import time
+
+    for i in range(12):
+        (tmp_path / f"file{i}.txt").write_text(str(i))
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def _transfer(d, kind, entry, target):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    with (
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(drive_mod, "_apply_transfer", side_effect=_transfer),
+        patch.object(drive_mod, "_write_slots", threading.BoundedSemaphore(3)),
+    ):
+        result = sync_folder(
+            _empty_remote_drive(), tmp_path, "folder_id", max_workers=8
+        )
+
+    assert result["created"] == 12
+    assert peak <= 3
+
+
+def test_sync_folder_creates_missing_folder_without_relisting(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("a")
+    drive_mod.clear_path_cache()
+
+    with (
+        patch.object(drive_mod, "list_files", return_value=[]) as list_mock,
+        patch.object(drive_mod, "create_folder", return_value="sub_id") as create,
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(drive_mod, "_apply_transfer") as transfer,
+    ):
+        result = sync_folder(MagicMock(), tmp_path, "folder_id")
+
+    # Only the snapshot listed the root; the missing folder was created directly.
+    assert list_mock.call_count == 1
+    create.assert_called_once_with(ANY, "sub", parent_id="folder_id")
+    assert transfer.call_args.args[1:3] == ("create", tmp_path / "sub" / "a.txt")
+    assert transfer.call_args.args[3] == "sub_id"
+    assert result["created"] == 2
+    drive_mod.clear_path_cache()
+
+
+def test_iter_files_stops_fetching_when_caller_stops() -> None:
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {"files": [{"id": "1"}, {"id": "2"}], "nextPageToken": "p2"},
+        {"files": [{"id": "3"}]},
+    ]
+
+    first = next(drive_mod.iter_files(mock_drive, fields="id"))
+
+    assert first == {"id": "1"}
+    assert mock_drive.files().list().execute.call_count == 1
+
+
+def test_list_files_limits_results_across_pages() -> None:
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.side_effect = [
+        {"files": [{"id": "1"}, {"id": "2"}], "nextPageToken": "p2"},
+        {"files": [{"id": "3"}, {"id": "4"}], "nextPageToken": "p3"},
+    ]
+
+    files = drive_mod.list_files(mock_drive, max_results=3, fields="id")
+
+    assert [f["id"] for f in files] == ["1", "2", "3"]
+    assert mock_drive.files().list().execute.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-15T10:30:00.000Z",
+        "2024-01-15T10:30:00.5Z",
+        "2024-01-15T10:30:00Z",
+        "2024-01-15T12:30:00.250+02:00",
+    ],
+)
+def test_rfc3339_to_epoch_matches_datetime(value: str) -> None:
+    from datetime import datetime
+
+    expected = datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    assert drive_mod._rfc3339_to_epoch(value) == pytest.approx(expected)
+
+
+def test_sync_folder_skips_newer_file_with_same_md5(tmp_path: Path) -> None:
+    import hashlib
+
+    (tmp_path / "same.txt").write_text("same")
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {
+        "files": [
+            {
+                "id": "s",
+                "name": "same.txt",
+                "modifiedTime": "2001-01-01T00:00:00.000Z",
+                "md5Checksum": hashlib.md5(b"same").hexdigest(),
+                "parents": ["folder_id"],
+            }
+        ]
+    }
+
+    with (
+        patch.object(drive_mod, "_apply_transfer") as transfer,
+        patch.object(drive_mod, "_local_md5", wraps=drive_mod._local_md5) as md5,
+    ):
+        first = sync_folder(
+            mock_drive, tmp_path, "folder_id", max_workers=1, use_hash_cache=True
+        )
+        second = sync_folder(
+            mock_drive, tmp_path, "folder_id", max_workers=1, use_hash_cache=True
+        )
+
+    assert first["skipped"] == second["skipped"] == 1
+    transfer.assert_not_called()
+    # The second run reused the hash from the sidecar cache.
+    assert md5.call_count == 1
+    assert (tmp_path / drive_mod.SYNC_HASH_CACHE_NAME).exists()
+
+
+def test_sync_folder_leaves_no_sidecar_by_default(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a")
+
+    with (
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(drive_mod, "_apply_transfer"),
+    ):
+        sync_folder(_empty_remote_drive(), tmp_path, "folder_id")
+
+    assert not (tmp_path / drive_mod.SYNC_HASH_CACHE_NAME).exists()
+
+
+def test_sync_folder_never_uploads_nested_sidecar(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("a")
+    (tmp_path / "sub" / drive_mod.SYNC_HASH_CACHE_NAME).write_text("{}")
+
+    with patch.object(drive_mod, "list_files", return_value=[]):
+        result = sync_folder(MagicMock(), tmp_path, "folder_id", dry_run=True)
+
+    names = [r["details"].get("file_name") for r in result["reports"]]
+    assert "a.txt" in names
+    assert drive_mod.SYNC_HASH_CACHE_NAME not in names
+
+
+def test_sync_folder_size_mismatch_skips_hashing(tmp_path: Path) -> None:
+    (tmp_path / "changed.txt").write_text("longer content")
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {
+        "files": [
+            {
+                "id": "c",
+                "name": "changed.txt",
+                "modifiedTime": "2001-01-01T00:00:00.000Z",
+                "size": "3",
+                "md5Checksum": "0" * 32,
+                "parents": ["folder_id"],
+            }
+        ]
+    }
+
+    with (
+        patch.object(drive_mod, "_apply_transfer") as transfer,
+        patch.object(drive_mod, "_local_md5") as md5,
+    ):
+        result = sync_folder(mock_drive, tmp_path, "folder_id", max_workers=1)
+
+    assert result["updated"] == 1
+    transfer.assert_called_once()
+    md5.assert_not_called()
+
+
+def test_sync_folder_progress_reuses_prescan(tmp_path: Path) -> None:
+    import os
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    progress = MagicMock()
+
+    with patch.object(drive_mod.os, "scandir", wraps=os.scandir) as scandir:
+        sync_folder(
+            _empty_remote_drive(),
+            tmp_path,
+            "folder_id",
+            dry_run=True,
+            progress_callback=progress,
+        )
+
+    # One directory read per local folder, shared by the count and the sync.
+    assert scandir.call_count == 2
+    assert [c.args[:2] for c in progress.call_args_list] == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_sync_folder_async_runs_sync_on_worker_thread(tmp_path: Path) -> None:
+    import asyncio
+    import threading
+
+    (tmp_path / "a.txt").write_text("a")
+    seen_threads = []
+
+    def _transfer(d, kind, entry, target):
+        seen_threads.append(threading.current_thread())
+
+    with (
+        patch.object(drive_mod, "_thread_drive", side_effect=lambda d: d),
+        patch.object(drive_mod, "_apply_transfer", side_effect=_transfer),
+    ):
+        result = asyncio.run(
+            drive_mod.sync_folder_async(
+                _empty_remote_drive(), tmp_path, "folder_id", max_workers=1
+            )
+        )
+
+    assert result["created"] == 1
+    assert seen_threads and seen_threads[0] is not threading.main_thread()
+
+
+def test_sync_folder_batches_missing_sibling_folders(tmp_path: Path) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+    drive_mod.clear_path_cache()
+
+    def _batch(drive, specs):
+        # "b" fails in the batch and is retried on its own.
+        names = [name for name, _ in specs]
+        ok = {i: f"{n}_id" for i, n in enumerate(names) if n != "b"}
+        return ok, {names.index("b"): RuntimeError("rate limited")}
+
+    with (
+        patch.object(drive_mod, "list_files", return_value=[]),
+        patch.object(drive_mod, "_create_folders_batch", side_effect=_batch) as batch,
+        patch.object(drive_mod, "create_folder", return_value="b_id") as single,
+    ):
+        result = sync_folder(MagicMock(), tmp_path, "folder_id")
+
+    specs = batch.call_args.args[1]
+    assert sorted(specs) == [("a", "folder_id"), ("b", "folder_id"), ("c", "folder_id")]
+    single.assert_called_once_with(ANY, "b", parent_id="folder_id")
+    assert result["created"] == 3
+    drive_mod.clear_path_cache()
+
+
+def test_sync_folder_batch_http_error_falls_back_to_single_creates(
+    tmp_path: Path,
+) -> None:
+    from googleapiclient.errors import HttpError
+
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+    drive_mod.clear_path_cache()
+    batch_error = HttpError(MagicMock(status=500), b"backend error")
+
+    with (
+        patch.object(drive_mod, "list_files", return_value=[]),
+        patch.object(drive_mod, "_create_folders_batch", side_effect=batch_error),
+        patch.object(drive_mod, "create_folder", return_value="x_id") as single,
+    ):
+        result = sync_folder(MagicMock(), tmp_path, "folder_id")
+
+    assert single.call_count == 2
+    assert result["created"] == 2
+    drive_mod.clear_path_cache()
+
+
+def test_sync_folder_recursive_lists_per_level_not_per_folder(tmp_path: Path) -> None:
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "f.txt").write_text(name)
+        os.utime(tmp_path / name / "f.txt", (1_000_000_000, 1_000_000_000))
+
+    def _item(file_id: str, name: str, parent: str, folder: bool = False) -> dict:
+        return {
+            "id": file_id,
+            "name": name,
+            "mimeType": drive_mod.FOLDER_MIME_TYPE if folder else "text/plain",
+            "modifiedTime": "2024-01-01T00:00:00.000Z",
+            "parents": [parent],
+        }
+
+    levels = [
+        [_item("a_id", "a", "root_id", True), _item("b_id", "b", "root_id", True)],
+        [_item("fa", "f.txt", "a_id"), _item("fb", "f.txt", "b_id")],
+    ]
+
+    with (
+        patch.object(drive_mod, "list_files", side_effect=levels) as list_mock,
+        patch.object(drive_mod, "create_folder") as create,
+        patch.object(drive_mod, "_apply_transfer") as transfer,
+    ):
+        result = sync_folder(MagicMock(), tmp_path, "root_id", max_workers=1)
+
+    # One listing for the root level and one for both subfolders together.
+    assert list_mock.call_count == 2
+    create.assert_not_called()
+    transfer.assert_not_called()
+    assert result["skipped"] == 2
+
+
+def test_list_files_clamps_page_size() -> None:
+    mock_drive = MagicMock()
+    mock_drive.files().list().execute.return_value = {"files": []}
+
+    drive_mod.list_files(mock_drive, page_size=5000)
+
+    assert mock_drive.files().list.call_args.kwargs["pageSize"] == 1000
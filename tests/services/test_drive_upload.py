@@ -0,0 +1,135 @@
+"""Tests for Drive upload helpers."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from mygooglib.services.drive import (
+    STREAM_CHUNK_SIZE,
+    _QueuedMediaUpload,
+    upload_stream,
+)
+
+
+def test_upload_stream_builds_resumable_media() -> None:
+    mock_drive = MagicMock()
+    mock_drive.files().create().execute.return_value = {"id": "new_id"}
+
+    file_id = upload_stream(
+        mock_drive, io.BytesIO(b"hello"), name="notes.txt", parent_id="folder"
+    )
+
+    assert file_id == "new_id"
+    kwargs = mock_drive.files().create.call_args.kwargs
+    assert kwargs["body"] == {"name": "notes.txt", "parents": ["folder"]}
+    media = kwargs["media_body"]
+    assert media.mimetype() == "text/plain"
+    assert media.resumable()
+    assert media.chunksize() == STREAM_CHUNK_SIZE
+
+
+def test_guess_mime_type() -> None:
+    from mygooglib.services.drive import _guess_mime_type
+
+    assert _guess_mime_type("report.PDF") == "application/pdf"
+    assert _guess_mime_type(Path("archive.tar.gz")) == "application/x-tar"
+    assert _guess_mime_type("no_extension") == "application/octet-stream"
+
+
+def test_upload_file_small_files_skip_resumable(tmp_path: Path) -> None:
+    from mygooglib.services import drive as drive_mod
+
+    small = tmp_path / "small.txt"
+    small.write_bytes(b"x" * 10)
+    mock_drive = MagicMock()
+    mock_drive.files().create().execute.return_value = {"id": "small_id"}
+    progress = MagicMock()
+
+    assert (
+        drive_mod.upload_file(mock_drive, small, progress_callback=progress)
+        == "small_id"
+    )
+
+    media = mock_drive.files().create.call_args.kwargs["media_body"]
+    assert not media.resumable()
+    progress.assert_called_once_with(10, 10)
+
+
+def test_upload_file_large_files_are_resumable(tmp_path: Path) -> None:
+    from mygooglib.services import drive as drive_mod
+
+    big = tmp_path / "big.bin"
+    with open(big, "wb") as f:
+        f.truncate(drive_mod.RESUMABLE_THRESHOLD + 1)
+    mock_drive = MagicMock()
+    mock_drive.files().create().execute.return_value = {"id": "big_id"}
+
+    drive_mod.upload_file(mock_drive, big)
+
+    media = mock_drive.files().create.call_args.kwargs["media_body"]
+    assert media.resumable()
+    # Streamed in a single PUT unless progress reporting needs chunks.
+    assert media.chunksize() == -1
+
+
+def test_upload_file_with_progress_uses_chunks(tmp_path: Path) -> None:
+    from mygooglib.services import drive as drive_mod
+
+    big = tmp_path / "big.bin"
+    with open(big, "wb") as f:
+        f.truncate(drive_mod.RESUMABLE_THRESHOLD + 1)
+    mock_drive = MagicMock()
+    mock_drive.files().create().next_chunk.return_value = (None, {"id": "big_id"})
+
+    drive_mod.upload_file(mock_drive, big, progress_callback=MagicMock())
+
+    media = mock_drive.files().create.call_args.kwargs["media_body"]
+    assert media.chunksize() == drive_mod.UPLOAD_CHUNK_SIZE
+
+
+def test_queued_media_reads_across_source_chunks() -> None:
+    media = _QueuedMediaUpload(iter([b"ab", b"cde", b"f"]), "text/plain")
+
+    assert media.size() is None
+    assert media.getbytes(0, 4) == b"abcd"
+    # A retry of the same chunk is served from the buffer.
+    assert media.getbytes(0, 4) == b"abcd"
+    assert media.getbytes(4, 4) == b"ef"
+    media.close()
+
+
+def test_queued_media_surfaces_source_errors() -> None:
+    def _source():
+        yield b"ok"
+        raise OSError("connection reset")
+
+    media = _QueuedMediaUpload(_source(), "text/plain")
+    with pytest.raises(OSError, match="connection reset"):
+        media.getbytes(0, 10)
+
+
+def test_upload_stream_from_iterator_drives_chunks() -> None:
+    mock_drive = MagicMock()
+    request = mock_drive.files().create.return_value
+    request.next_chunk.side_effect = [
+        (MagicMock(resumable_progress=STREAM_CHUNK_SIZE), None),
+        (None, {"id": "streamed_id"}),
+    ]
+    progress = MagicMock()
+
+    file_id = upload_stream(
+        mock_drive,
+        (b"x" * 1024 for _ in range(3)),
+        name="data.bin",
+        progress_callback=progress,
+    )
+
+    assert file_id == "streamed_id"
+    media = mock_drive.files().create.call_args.kwargs["media_body"]
+    assert media.size() is None
+    assert media.resumable()
+    progress.assert_called_once_with(STREAM_CHUNK_SIZE, None)
@@ -0,0 +1,39 @@
+"""Tests for the process-wide get_clients() cache."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from mygooglib.core import client as client_mod
+
+
+def test_default_clients_built_once_across_threads() -> None:
+    with (
+        patch.object(client_mod, "_DEFAULT_CLIENTS", None),
+        patch.object(client_mod, "get_creds", return_value=MagicMock()) as get_creds,
+    ):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: client_mod.get_clients(), range(16)))
+
+        assert get_creds.call_count == 1
+        assert all(r is results[0] for r in results)
+
+
+def test_explicit_creds_bypass_cache() -> None:
+    with patch.object(client_mod, "_DEFAULT_CLIENTS", None):
+        a = client_mod.get_clients(MagicMock())
+        b = client_mod.get_clients(MagicMock())
+
+        assert a is not b
+        assert client_mod._DEFAULT_CLIENTS is None
+
+
+def test_sheets_and_docs_share_drive_service() -> None:
+    with patch.object(client_mod, "build", side_effect=lambda *a, **k: MagicMock()):
+        clients = client_mod.Clients(MagicMock())
+
+        drive_service = clients.drive.service
+        assert clients.sheets.drive is drive_service
+        assert clients.docs.drive is drive_service
+        assert client_mod.build.call_count == 3
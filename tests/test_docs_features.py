@@ -1,7 +1,16 @@
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock
 
-from mygooglib.services.docs import find_replace
+from mygooglib.core.utils.doc_cache import DocTextCache
+from mygooglib.services.docs import (
+    append_text,
+    find_replace,
+    get_text,
+    get_text_cached,
+    render_templates_bulk,
+)
 
 
 class TestDocsFindReplace(unittest.TestCase):
@@ -44,5 +53,126 @@ class TestDocsFindReplace(unittest.TestCase):
         mock_docs.documents().batchUpdate.assert_not_called()
 
 
+class TestDocsGetText(unittest.TestCase):
+    def test_get_text_requests_only_text_runs(self):
+        mock_docs = MagicMock()
+        mock_docs.documents().get.return_value.execute.return_value = {
+            "body": {
+                "content": [
+                    {"sectionBreak": {}},
+                    {
+                        "paragraph": {
+                            "elements": [
+                                {"textRun": {"content": "Hello "}},
+                                {"inlineObjectElement": {}},
+                                {"textRun": {"content": "world\n"}},
+                            ]
+                        }
+                    },
+                ]
+            }
+        }
+
+        self.assertEqual(get_text(mock_docs, "doc-123"), "Hello world\n")
+        call_kwargs = mock_docs.documents().get.call_args[1]
+        self.assertEqual(
+            call_kwargs["fields"], "body/content(paragraph/elements/textRun/content)"
+        )
+
+
+class TestDocsAppendText(unittest.TestCase):
+    def test_append_text_uses_end_of_segment_without_get(self):
+        mock_docs = MagicMock()
+
+        append_text(mock_docs, "doc-123", "hello")
+
+        mock_docs.documents().get.assert_not_called()
+        call_kwargs = mock_docs.documents().batchUpdate.call_args[1]
+        self.assertEqual(
+            call_kwargs["body"]["requests"],
+            [{"insertText": {"endOfSegmentLocation": {}, "text": "hello"}}],
+        )
+
+
+class TestDocsRenderTemplatesBulk(unittest.TestCase):
+    @staticmethod
+    def _batching_service(responses):
+        """Service whose batches immediately answer each request_id."""
+
+        def _new_batch():
+            batch = MagicMock()
+            added = []
+            batch.add.side_effect = lambda req, callback, request_id: added.append(
+                (request_id, callback)
+            )
+            batch.execute.side_effect = lambda: [
+                cb(rid, responses(rid), None) for rid, cb in added
+            ]
+            return batch
+
+        service = MagicMock()
+        service.new_batch_http_request.side_effect = _new_batch
+        return service
+
+    def test_copies_and_updates_in_batches(self):
+        mock_drive = self._batching_service(lambda rid: {"id": f"new-{rid}"})
+        mock_docs = self._batching_service(lambda rid: {"replies": []})
+
+        ids = render_templates_bulk(
+            mock_docs,
+            mock_drive,
+            [
+                {"template_id": "tpl", "data": {"name": "A"}, "title": "Doc A"},
+                {"template_id": "tpl", "data": {}},
+            ],
+        )
+
+        self.assertEqual(ids, ["new-0", "new-1"])
+        self.assertEqual(mock_drive.new_batch_http_request.call_count, 1)
+        # Only the job with data needs a batchUpdate.
+        mock_docs.documents().batchUpdate.assert_called_once()
+        call_kwargs = mock_docs.documents().batchUpdate.call_args[1]
+        self.assertEqual(call_kwargs["documentId"], "new-0")
+
+    def test_empty_jobs_makes_no_calls(self):
+        mock_docs = MagicMock()
+        mock_drive = MagicMock()
+        self.assertEqual(render_templates_bulk(mock_docs, mock_drive, []), [])
+        mock_drive.new_batch_http_request.assert_not_called()
+
+
+class TestDocsGetTextCached(unittest.TestCase):
+    def test_second_read_of_same_revision_skips_body(self):
+        body = {
+            "revisionId": "rev-1",
+            "body": {
+                "content": [
+                    {"paragraph": {"elements": [{"textRun": {"content": "Hi"}}]}}
+                ]
+            },
+        }
+        mock_docs = MagicMock()
+        mock_docs.documents().get.return_value.execute.side_effect = [
+            {"revisionId": "rev-1"},
+            body,
+            {"revisionId": "rev-1"},
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DocTextCache(Path(tmp) / "cache.db")
+            self.assertEqual(get_text_cached(mock_docs, "doc-1", cache=cache), "Hi")
+            self.assertEqual(get_text_cached(mock_docs, "doc-1", cache=cache), "Hi")
+
+        fields = [c[1]["fields"] for c in mock_docs.documents().get.call_args_list]
+        self.assertEqual(
+            fields,
+            [
+                "revisionId",
+                "revisionId,body/content(paragraph/elements/textRun/content)",
+                "revisionId",
+            ],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,16 @@
 """Tests for Gmail attachment functions."""
 
 import base64
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mygooglib.services import gmail as gmail_mod
 from mygooglib.services.gmail import (
     _extract_attachments,
+    _guess_mime,
+    download_attachment,
     get_attachment,
     save_attachments,
 )
@@ -19,6 +23,16 @@ def mock_gmail():
     return MagicMock()
 
 
+def _writes(data):
+    """Side effect for a patched download_attachment that writes data."""
+
+    def _download(service, msg_id, att_id, target, **kwargs):
+        target.write_bytes(data)
+        return target
+
+    return _download
+
+
 def test_get_attachment_returns_bytes(mock_gmail):
     """Test that get_attachment decodes base64 data correctly."""
     # Create mock attachment data
@@ -40,6 +54,37 @@ def test_get_attachment_returns_bytes(mock_gmail):
     assert isinstance(result, bytes)
 
 
+def test_download_attachment_streams_in_chunks(mock_gmail, tmp_path):
+    """Chunked decoding reproduces the payload across chunk boundaries."""
+    original_data = bytes(range(256)) * 1000
+    encoded_data = base64.urlsafe_b64encode(original_data).decode("ascii")
+    dest = tmp_path / "blob.bin"
+
+    with (
+        patch.object(gmail_mod, "_ATTACHMENT_DECODE_CHUNK", 1024),
+        patch(
+            "mygooglib.services.gmail.execute_with_retry_http_error",
+            return_value={"data": encoded_data},
+        ),
+    ):
+        result = download_attachment(mock_gmail, "msg123", "att456", dest)
+
+    assert result == dest
+    assert dest.read_bytes() == original_data
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Invoice.PDF", ("application", "pdf")),
+        ("archive.tar.gz", ("application", "x-tar")),
+        ("README", ("application", "octet-stream")),
+    ],
+)
+def test_guess_mime_by_suffix(name, expected):
+    assert _guess_mime(Path(name)) == expected
+
+
 def test_extract_attachments_finds_parts():
     """Test that _extract_attachments correctly extracts attachment metadata."""
     payload = {
@@ -66,7 +111,7 @@ def test_extract_attachments_finds_parts():
     assert result[1]["filename"] == "image.png"
 
 
-@patch("mygooglib.services.gmail.get_attachment")
+@patch("mygooglib.services.gmail.download_attachment")
 @patch("mygooglib.services.gmail.search_messages")
 @patch("mygooglib.services.gmail.execute_with_retry_http_error")
 def test_save_attachments_creates_files(
@@ -89,7 +134,7 @@ def test_save_attachments_creates_files(
     mock_execute.return_value = MessageFactory.build(id="msg123", payload=payload)  # type: ignore
 
     # Mock attachment download
-    mock_get_att.return_value = b"File content here"
+    mock_get_att.side_effect = _writes(b"File content here")
 
     # Call save_attachments
     result = save_attachments(mock_gmail, "has:attachment", tmp_path)
@@ -100,7 +145,7 @@ def test_save_attachments_creates_files(
     assert result[0].read_bytes() == b"File content here"
 
 
-@patch("mygooglib.services.gmail.get_attachment")
+@patch("mygooglib.services.gmail.download_attachment")
 @patch("mygooglib.services.gmail.search_messages")
 @patch("mygooglib.services.gmail.execute_with_retry_http_error")
 def test_save_attachments_applies_filter(
@@ -125,7 +170,7 @@ def test_save_attachments_applies_filter(
     }
     mock_execute.return_value = MessageFactory.build(id="msg123", payload=payload)  # type: ignore
 
-    mock_get_att.return_value = b"PDF content"
+    mock_get_att.side_effect = _writes(b"PDF content")
     # Filter to only PDFs
     result = save_attachments(
         mock_gmail, "has:attachment", tmp_path, filename_filter="pdf"
@@ -133,3 +178,41 @@ def test_save_attachments_applies_filter(
 
     assert len(result) == 1
     assert result[0].name == "invoice.pdf"
+
+
+@patch("mygooglib.services.gmail.download_attachment")
+@patch("mygooglib.services.gmail.get_message")
+@patch("mygooglib.services.gmail.search_messages")
+def test_save_attachments_parallel_keeps_message_order(
+    mock_search, mock_get_msg, mock_get_att, mock_gmail, tmp_path
+):
+    """Concurrent fetches still save same-named files in message order."""
+    mock_search.return_value = [{"id": f"msg{i}xxxxx"} for i in range(4)]
+
+    def _message(service, msg_id, **kwargs):
+        part = {
+            "filename": "report.pdf",
+            "mimeType": "application/pdf",
+            "body": {"attachmentId": f"att-{msg_id}", "size": 10},
+        }
+        return {"id": msg_id, "payload": {"parts": [part]}}
+
+    mock_get_msg.side_effect = _message
+
+    def _download(service, msg_id, att_id, target, **kw):
+        target.write_bytes(att_id.encode())
+        return target
+
+    mock_get_att.side_effect = _download
+
+    with patch("mygooglib.services.gmail._thread_gmail", side_effect=lambda g: g):
+        result = save_attachments(mock_gmail, "has:attachment", tmp_path, max_workers=4)
+
+    assert [p.name for p in result] == [
+        "report.pdf",
+        "report_msg1xxxx.pdf",
+        "report_msg2xxxx.pdf",
+        "report_msg3xxxx.pdf",
+    ]
+    assert result[0].read_bytes() == b"att-msg0xxxxx"
+    assert result[3].read_bytes() == b"att-msg3xxxxx"
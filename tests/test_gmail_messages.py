@@ -0,0 +1,155 @@
+"""Tests for Gmail message building and body extraction."""
+
+import base64
+import email
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mygooglib.services.gmail import (
+    _headers_to_dict,
+    bulk_mark_read,
+    get_message,
+    send_email,
+    send_email_bulk,
+)
+
+
+def _b64(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).decode("ascii")
+
+
+_MESSAGE = {
+    "id": "m1",
+    "payload": {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {
+                "mimeType": "multipart/alternative",
+                "parts": [
+                    {"mimeType": "text/plain", "body": {"data": _b64("first")}},
+                    {"mimeType": "text/html", "body": {"data": _b64("<p>x</p>")}},
+                ],
+            },
+            {"mimeType": "text/plain", "body": {"data": _b64("second")}},
+        ],
+    },
+}
+
+
+def test_headers_to_dict_normalizes_names_and_values():
+    headers = [
+        {"name": "From", "value": " a@example.com "},
+        {"name": " ", "value": "ignored"},
+        {"name": "SUBJECT"},
+        {"value": "no name"},
+    ]
+
+    assert _headers_to_dict(headers) == {"from": "a@example.com", "subject": ""}
+    assert _headers_to_dict(None) == {}
+
+
+def test_get_message_concatenates_text_parts_by_default():
+    with patch(
+        "mygooglib.services.gmail.execute_with_retry_http_error",
+        return_value=_MESSAGE,
+    ):
+        result = get_message(MagicMock(), "m1")
+
+    assert result["body"] == "firstsecond"
+
+
+def test_get_message_prefer_first_stops_at_first_text_part():
+    with patch(
+        "mygooglib.services.gmail.execute_with_retry_http_error",
+        return_value=_MESSAGE,
+    ):
+        result = get_message(MagicMock(), "m1", prefer_first=True)
+
+    assert result["body"] == "first"
+
+
+def test_send_email_bulk_reads_attachments_once(tmp_path):
+    attachment = tmp_path / "notes.txt"
+    attachment.write_text("shared")
+    gmail = MagicMock()
+    gmail.users().messages().send().execute.side_effect = [{"id": "a"}, {"id": "b"}]
+
+    with patch.object(Path, "read_bytes", autospec=True, return_value=b"x") as read:
+        ids = send_email_bulk(
+            gmail,
+            to_list=["one@example.com", ["two@example.com", "three@example.com"]],
+            subject="Hi",
+            body="Body",
+            attachments=[attachment],
+        )
+
+    assert ids == ["a", "b"]
+    assert read.call_count == 1
+    sent = [
+        email.message_from_bytes(base64.urlsafe_b64decode(c.kwargs["body"]["raw"]))
+        for c in gmail.users().messages().send.call_args_list
+        if c.kwargs
+    ]
+    assert [m["To"] for m in sent] == [
+        "one@example.com",
+        "two@example.com, three@example.com",
+    ]
+
+
+def test_send_email_rereads_attachment_only_when_changed(tmp_path):
+    attachment = tmp_path / "report.txt"
+    attachment.write_text("v1")
+    gmail = MagicMock()
+    gmail.users().messages().send().execute.return_value = {"id": "x"}
+    original_read = Path.read_bytes
+
+    with patch.object(
+        Path, "read_bytes", autospec=True, side_effect=original_read
+    ) as read:
+        for _ in range(2):
+            send_email(
+                gmail,
+                to="a@example.com",
+                subject="s",
+                body="b",
+                attachments=[attachment],
+            )
+        attachment.write_text("version 2")
+        send_email(
+            gmail, to="a@example.com", subject="s", body="b", attachments=[attachment]
+        )
+
+    assert read.call_count == 2
+
+
+def test_bulk_mark_read_chunks_batch_modify():
+    gmail = MagicMock()
+    ids = [f"m{i}" for i in range(2500)]
+
+    bulk_mark_read(gmail, ids)
+
+    calls = [
+        c.kwargs["body"]
+        for c in gmail.users().messages().batchModify.call_args_list
+        if c.kwargs
+    ]
+    assert [len(body["ids"]) for body in calls] == [1000, 1000, 500]
+    assert all(body["removeLabelIds"] == ["UNREAD"] for body in calls)
+    assert [i for body in calls for i in body["ids"]] == ids
+
+
+def test_send_email_missing_attachment_raises(tmp_path):
+    gmail = MagicMock()
+
+    with pytest.raises(FileNotFoundError, match="Attachment not found"):
+        send_email(
+            gmail,
+            to="a@example.com",
+            subject="s",
+            body="b",
+            attachments=[str(tmp_path / "missing.pdf")],
+        )
+
+    gmail.users().messages().send.assert_not_called()
@@ -0,0 +1,74 @@
+"""Tests for Gmail search_messages batching."""
+
+from unittest.mock import MagicMock
+
+from mygooglib.services import gmail as gmail_mod
+from mygooglib.services.gmail import search_messages
+
+
+def _search_gmail(message_count: int) -> tuple[MagicMock, list[int]]:
+    """Gmail mock with one list page whose batches answer every add()."""
+    gmail = MagicMock()
+    gmail.users().messages().list().execute.return_value = {
+        "messages": [{"id": f"m{i}"} for i in range(message_count)]
+    }
+    batch_sizes: list[int] = []
+
+    def _new_batch():
+        added: list[tuple] = []
+        batch = MagicMock()
+        batch.add.side_effect = lambda req, callback, request_id: added.append(
+            (callback, request_id)
+        )
+
+        def _execute():
+            batch_sizes.append(len(added))
+            for callback, request_id in added:
+                meta = {"id": request_id, "payload": {"headers": []}}
+                callback(request_id, meta, None)
+
+        batch.execute.side_effect = _execute
+        return batch
+
+    gmail.new_batch_http_request.side_effect = _new_batch
+    return gmail, batch_sizes
+
+
+def test_search_messages_splits_batches_at_gmail_limit():
+    gmail, batch_sizes = _search_gmail(250)
+
+    results = search_messages(gmail, "in:inbox", max_results=250)
+
+    assert batch_sizes == [gmail_mod._BATCH_MAX_CALLS, gmail_mod._BATCH_MAX_CALLS, 50]
+    assert [r["id"] for r in results] == [f"m{i}" for i in range(250)]
+
+
+def test_search_messages_keeps_sender_unless_disabled():
+    gmail, _ = _search_gmail(1)
+
+    (legacy,) = search_messages(gmail, "in:inbox", max_results=1)
+    (lean,) = search_messages(
+        gmail, "in:inbox", max_results=1, legacy_sender_field=False
+    )
+
+    assert "sender" in legacy and legacy["sender"] == legacy["from"]
+    assert "sender" not in lean
+
+
+def test_search_messages_async_runs_on_thread_clone():
+    import asyncio
+    from unittest.mock import patch
+
+    clone, _ = _search_gmail(2)
+
+    async def _gather():
+        return await asyncio.gather(
+            gmail_mod.search_messages_async(MagicMock(), "a"),
+            gmail_mod.search_messages_async(MagicMock(), "b"),
+        )
+
+    with patch.object(gmail_mod, "_thread_gmail", return_value=clone) as thread_gmail:
+        results = asyncio.run(_gather())
+
+    assert [[r["id"] for r in res] for res in results] == [["m0", "m1"]] * 2
+    assert thread_gmail.call_count == 2
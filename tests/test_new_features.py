@@ -147,10 +147,8 @@ class TestIdempotencyStore:
 
         mock_service = MagicMock()
 
-        # Patch the IdempotencyStore at the import location inside gmail.send_email
-        with patch(
-            "mygooglib.core.utils.idempotency.IdempotencyStore", return_value=store
-        ):
+        # Patch the store send_email shares across calls
+        with patch("mygooglib.services.gmail._idempotency_store", return_value=store):
             result = send_email(
                 mock_service,
                 to="test@example.com",
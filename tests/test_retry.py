@@ -144,6 +144,54 @@ class TestRetryAfterHeader:
         assert 4.0 < sleep_call < 6.0  # Expecting ~5s with jitter
 
 
+class TestExecuteWithRetryAsync:
+    """Tests for the asyncio variant."""
+
+    def test_retries_with_async_sleep(self):
+        """Backoff should await asyncio.sleep rather than block in time.sleep."""
+        import asyncio
+
+        from mygooglib.core.utils.retry import execute_with_retry_async
+
+        mock_request = MagicMock()
+        mock_resp = MagicMock()
+        mock_resp.status = 503
+        mock_resp.get = MagicMock(return_value=None)
+        mock_request.execute.side_effect = [
+            HttpError(resp=mock_resp, content=b"Unavailable"),
+            {"status": "ok"},
+        ]
+
+        async def _no_sleep(_s):
+            return None
+
+        with (
+            patch(
+                "mygooglib.core.utils.retry.asyncio.sleep", side_effect=_no_sleep
+            ) as a_sleep,
+            patch("mygooglib.core.utils.retry.time.sleep") as t_sleep,
+        ):
+            result = asyncio.run(execute_with_retry_async(mock_request, attempts=2))
+
+        assert result == {"status": "ok"}
+        assert a_sleep.call_count == 1
+        t_sleep.assert_not_called()
+
+    def test_non_retryable_raises(self):
+        import asyncio
+
+        from mygooglib.core.utils.retry import execute_with_retry_async
+
+        mock_request = MagicMock()
+        mock_resp = MagicMock()
+        mock_resp.status = 404
+        mock_request.execute.side_effect = HttpError(resp=mock_resp, content=b"")
+
+        with pytest.raises(HttpError):
+            asyncio.run(execute_with_retry_async(mock_request, attempts=3))
+        assert mock_request.execute.call_count == 1
+
+
 class TestEnvConfiguration:
     """Tests for environment variable configuration."""
 
@@ -166,6 +214,28 @@ class TestEnvConfiguration:
         # With retry disabled, only 1 attempt
         assert mock_request.execute.call_count == 1
 
+    def test_jitter_disabled_via_env(self):
+        """MYGOOGLIB_RETRY_JITTER=0 should sleep for the exact backoff."""
+        from mygooglib.core.utils.retry import execute_with_retry_http_error
+
+        mock_request = MagicMock()
+        mock_resp = MagicMock()
+        mock_resp.status = 503
+        mock_resp.get = MagicMock(return_value=None)
+
+        mock_request.execute.side_effect = [
+            HttpError(resp=mock_resp, content=b"Unavailable"),
+            {"status": "ok"},
+        ]
+
+        with patch.dict(os.environ, {"MYGOOGLIB_RETRY_JITTER": "0"}):
+            with patch("mygooglib.core.utils.retry.time.sleep") as mock_sleep:
+                execute_with_retry_http_error(
+                    mock_request, attempts=2, initial_backoff_s=0.5
+                )
+
+        mock_sleep.assert_called_once_with(0.5)
+
 
 class TestEnvHelpers:
     """Tests for environment variable helper functions."""
@@ -215,3 +285,137 @@ class TestEnvHelpers:
 
         with patch.dict(os.environ, {"TEST_FLOAT": "3.14"}):
             assert _env_float("TEST_FLOAT", 0.0) == 3.14
+
+
+class TestResponseCache:
+    """Tests for the opt-in TTL response cache."""
+
+    def setup_method(self):
+        from mygooglib.core.utils.retry import clear_response_cache
+
+        clear_response_cache()
+
+    _HTTP = MagicMock()
+
+    def _request(self, uri="https://example.test/files", http=_HTTP):
+        mock_request = MagicMock()
+        mock_request.http = http
+        mock_request.uri = uri
+        mock_request.method = "GET"
+        mock_request.body = None
+        mock_request.execute.return_value = {"status": "ok"}
+        return mock_request
+
+    def test_identical_reads_hit_cache(self):
+        from mygooglib.core.utils.retry import execute_with_retry_http_error
+
+        first = self._request()
+        second = self._request()
+
+        assert execute_with_retry_http_error(first, cache_ttl_s=60) == {"status": "ok"}
+        assert execute_with_retry_http_error(second, cache_ttl_s=60) == {"status": "ok"}
+        assert first.execute.call_count == 1
+        assert second.execute.call_count == 0
+
+    def test_other_credentials_do_not_share_cache(self):
+        from mygooglib.core.utils.retry import execute_with_retry_http_error
+
+        first = self._request()
+        second = self._request(http=MagicMock())
+
+        execute_with_retry_http_error(first, cache_ttl_s=60)
+        execute_with_retry_http_error(second, cache_ttl_s=60)
+        assert first.execute.call_count == 1
+        assert second.execute.call_count == 1
+
+    def test_expired_entries_are_refetched(self):
+        from mygooglib.core.utils.retry import execute_with_retry_http_error
+
+        request = self._request()
+        with patch(
+            "mygooglib.core.utils.retry.time.monotonic", side_effect=[0, 100, 100]
+        ):
+            execute_with_retry_http_error(request, cache_ttl_s=10)
+            execute_with_retry_http_error(request, cache_ttl_s=10)
+        assert request.execute.call_count == 2
+
+    def test_writes_bypass_cache(self):
+        from mygooglib.core.utils.retry import execute_with_retry_http_error
+
+        request = self._request()
+        execute_with_retry_http_error(request, is_write=True, cache_ttl_s=60)
+        execute_with_retry_http_error(request, is_write=True, cache_ttl_s=60)
+        assert request.execute.call_count == 2
+
+
+class _FakeBatch:
+    """Minimal BatchHttpRequest stand-in that replays scripted outcomes."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.added = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.added.append((request_id, callback))
+
+    def execute(self):
+        for request_id, callback in self.added:
+            outcome = self.outcomes[request_id].pop(0)
+            if isinstance(outcome, Exception):
+                callback(request_id, None, outcome)
+            else:
+                callback(request_id, outcome, None)
+
+
+class TestExecuteBatchWithRetry:
+    """Tests for execute_batch_with_retry."""
+
+    def _service(self, outcomes):
+        service = MagicMock()
+        batches = []
+
+        def _new_batch():
+            batch = _FakeBatch(outcomes)
+            batches.append(batch)
+            return batch
+
+        service.new_batch_http_request.side_effect = _new_batch
+        return service, batches
+
+    def test_chunks_to_batch_limit(self):
+        from mygooglib.core.utils.retry import execute_batch_with_retry
+
+        outcomes = {str(i): [{"id": i}] for i in range(5)}
+        service, batches = self._service(outcomes)
+
+        results, errors = execute_batch_with_retry(
+            service, {str(i): MagicMock() for i in range(5)}, batch_limit=2
+        )
+
+        assert errors == {}
+        assert len(results) == 5
+        assert [len(b.added) for b in batches] == [2, 2, 1]
+
+    def test_resubmits_only_retryable_failures(self):
+        from mygooglib.core.utils.retry import execute_batch_with_retry
+
+        resp_429 = MagicMock(status=429)
+        resp_429.get = MagicMock(return_value=None)
+        resp_404 = MagicMock(status=404)
+        outcomes = {
+            "ok": [{"id": "ok"}],
+            "rate": [HttpError(resp=resp_429, content=b""), {"id": "rate"}],
+            "missing": [HttpError(resp=resp_404, content=b"")],
+        }
+        service, batches = self._service(outcomes)
+
+        with patch("mygooglib.core.utils.retry.time.sleep"):
+            results, errors = execute_batch_with_retry(
+                service,
+                {"ok": MagicMock(), "rate": MagicMock(), "missing": MagicMock()},
+                attempts=2,
+            )
+
+        assert set(results) == {"ok", "rate"}
+        assert set(errors) == {"missing"}
+        assert [rid for rid, _ in batches[1].added] == ["rate"]
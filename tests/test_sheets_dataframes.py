@@ -0,0 +1,32 @@
+"""Tests for reading several Sheets ranges into DataFrames."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mygooglib.services.sheets import to_dataframes
+
+pd = pytest.importorskip("pandas")
+
+SPREADSHEET_ID = "1AbCdEfGhIjKlMnOpQrStUvWxYz0123456789"
+
+
+def test_to_dataframes_uses_one_batch_get():
+    """Each requested range maps to its own DataFrame from a single call."""
+    mock_sheets = MagicMock()
+    batch_get = mock_sheets.spreadsheets().values().batchGet
+    batch_get.return_value.execute.return_value = {
+        "valueRanges": [
+            {"range": "Sheet1!A1:B3", "values": [["a", "b"], [1, 2], [3, 4]]},
+            {"range": "Empty!A1:Z1000"},
+        ]
+    }
+
+    frames = to_dataframes(mock_sheets, SPREADSHEET_ID, ["Sheet1!A1:B3", "Empty"])
+
+    batch_get.assert_called_once()
+    assert batch_get.call_args.kwargs["ranges"] == ["Sheet1!A1:B3", "Empty"]
+    assert list(frames) == ["Sheet1!A1:B3", "Empty"]
+    assert list(frames["Sheet1!A1:B3"].columns) == ["a", "b"]
+    assert frames["Sheet1!A1:B3"].values.tolist() == [[1, 2], [3, 4]]
+    assert frames["Empty"].empty
@@ -0,0 +1,33 @@
+"""Tests for mygooglib.core.utils.base.BaseClient."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from mygooglib.core.utils.base import BaseClient
+
+
+def test_getattr_delegates_to_service():
+    service = MagicMock()
+    client = BaseClient(service)
+
+    assert client.files is service.files
+
+
+def test_forwarded_attribute_is_cached_on_instance():
+    service = MagicMock()
+    client = BaseClient(service)
+
+    first = client.messages
+    assert client.__dict__["messages"] is first
+    assert client.messages is first
+
+
+def test_reassigning_service_drops_forwarded_attributes():
+    client = BaseClient(MagicMock())
+    stale = client.messages
+
+    client.service = MagicMock()
+
+    assert client.messages is not stale
+    assert client.messages is client.service.messages
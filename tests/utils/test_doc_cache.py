@@ -0,0 +1,36 @@
+"""Tests for DocTextCache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from mygooglib.core.utils.doc_cache import DocTextCache
+
+
+def test_new_revision_replaces_old(tmp_path: Path) -> None:
+    cache = DocTextCache(tmp_path / "cache.db")
+    cache.put("doc", "rev-1", "old")
+    cache.put("doc", "rev-2", "new")
+
+    assert cache.get("doc", "rev-1") is None
+    assert cache.get("doc", "rev-2") == "new"
+
+
+def test_evicts_least_recently_used_over_budget(tmp_path: Path) -> None:
+    cache = DocTextCache(tmp_path / "cache.db", max_size_bytes=10)
+    cache.put("a", "r", "aaaa")
+    cache.put("b", "r", "bbbb")
+    assert cache.get("a", "r") == "aaaa"  # touch "a" so "b" is the LRU entry
+
+    cache.put("c", "r", "cccc")
+
+    assert cache.get("a", "r") == "aaaa"
+    assert cache.get("b", "r") is None
+    assert cache.get("c", "r") == "cccc"
+
+
+def test_oversized_text_is_not_stored(tmp_path: Path) -> None:
+    cache = DocTextCache(tmp_path / "cache.db", max_size_bytes=3)
+    cache.put("doc", "r", "too long")
+
+    assert cache.get("doc", "r") is None
@@ -16,17 +16,17 @@ def test_scan_directory_with_files(tmp_path):
     results = scanner.scan(str(tmp_path))
 
     # Sort results by filename to ensure deterministic assertions
-    results.sort(key=lambda x: x["filename"])
+    results.sort(key=lambda x: x.filename)
 
     assert len(results) == 2
 
-    assert results[0]["filename"] == "test1.txt"
-    assert results[0]["absolute_path"] == str(file1)
-    assert isinstance(results[0]["last_modified_timestamp"], float)
+    assert results[0].filename == "test1.txt"
+    assert results[0].absolute_path == str(file1)
+    assert isinstance(results[0].last_modified_timestamp, float)
 
-    assert results[1]["filename"] == "test2.csv"
-    assert results[1]["absolute_path"] == str(file2)
-    assert isinstance(results[1]["last_modified_timestamp"], float)
+    assert results[1].filename == "test2.csv"
+    assert results[1].absolute_path == str(file2)
+    assert isinstance(results[1].last_modified_timestamp, float)
 
 
 def test_scan_empty_directory(tmp_path):
@@ -55,4 +55,16 @@ def test_scan_skips_directories(tmp_path):
     results = scanner.scan(str(tmp_path))
 
     assert len(results) == 1
-    assert results[0]["filename"] == "root.txt"
+    assert results[0].filename == "root.txt"
+
+
+def test_scan_iter_is_lazy(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+
+    scanner = FileScanner()
+    it = scanner.scan_iter(str(tmp_path))
+
+    assert not isinstance(it, list)
+    results = list(it)
+    assert len(results) == 1
+    assert results[0].filename == "a.txt"
@@ -0,0 +1,40 @@
+"""Tests for mygooglib.core.utils.json_backend."""
+
+from __future__ import annotations
+
+import json
+
+import googleapiclient.model
+import pytest
+from googleapiclient.model import JsonModel
+
+from mygooglib.core.utils.json_backend import configure_json_backend
+
+
+@pytest.fixture(autouse=True)
+def _restore_stdlib_json():
+    yield
+    configure_json_backend("json")
+
+
+def test_default_backend_is_stdlib():
+    assert configure_json_backend("json") == "json"
+    assert googleapiclient.model.json is json
+
+
+def test_unknown_backend_falls_back_to_stdlib():
+    assert configure_json_backend("does-not-exist") == "json"
+    assert googleapiclient.model.json is json
+
+
+def test_orjson_backend_decodes_responses():
+    pytest.importorskip("orjson")
+
+    assert configure_json_backend("orjson") == "orjson"
+
+    model = JsonModel()
+    assert model.deserialize(b'{"values": [[1, 2]]}') == {"values": [[1, 2]]}
+    # Non-JSON bodies are still passed through untouched.
+    assert model.deserialize(b"not json") == "not json"
+    # Request bodies keep using stdlib json.dumps (str output).
+    assert model.serialize({"a": 1}) == '{"a": 1}'
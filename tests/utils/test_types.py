@@ -6,6 +6,8 @@ and can be used for static type checking with mypy.
 
 from __future__ import annotations
 
+import pytest
+
 from mygooglib.core.types import (
     AppendValuesResponseDict,
     BatchGetValuesResponseDict,
@@ -16,6 +18,7 @@ from mygooglib.core.types import (
     ColorDict,
     DateDict,
     MessageDict,
+    MessageMetadataTable,
     RangeData,
     RowData,
     SendMessageResponseDict,
@@ -171,6 +174,29 @@ class TestGmailTypes:
         assert response["id"] == "msg789"
 
 
+class TestMessageMetadataTable:
+    """Test the column-oriented search result table."""
+
+    def test_from_messages_builds_columns(self) -> None:
+        table = MessageMetadataTable.from_messages(
+            [
+                {"id": "m1", "threadId": "t1", "subject": "Hi", "from": "a@x.com"},
+                {"id": "m2", "threadId": "t2", "labelIds": ["INBOX", "UNREAD"]},
+            ]
+        )
+        assert len(table) == 2
+        assert table.ids == ["m1", "m2"]
+        assert table.from_ == ["a@x.com", None]
+        assert table.is_unread == [False, True]
+
+    def test_to_pandas(self) -> None:
+        pd = pytest.importorskip("pandas")
+        table = MessageMetadataTable.from_messages([{"id": "m1", "threadId": "t1"}])
+        df = table.to_pandas()
+        assert isinstance(df, pd.DataFrame)
+        assert list(df["id"]) == ["m1"]
+
+
 class TestTypeAliases:
     """Test type alias definitions."""
 